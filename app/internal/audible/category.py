@@ -9,6 +9,21 @@ from app.internal.audible.types import audible_region_type
 from app.internal.models import Audiobook, AudiobookRequest, AudiobookWithRequests
 from app.util.log import logger
 
+# max amount of concurrent Audible searches of a single combined/category listing
+_MAX_CONCURRENT_SEARCHES = 6
+
+
+def _get_requested_asins(session: Session, username: str | None) -> set[str]:
+    if not username:
+        return set()
+    return set(
+        session.exec(
+            select(AudiobookRequest.asin).where(
+                AudiobookRequest.user_username == username
+            )
+        )
+    )
+
 
 async def list_combined_audible_books(
     session: Session,
@@ -17,53 +32,60 @@ async def list_combined_audible_books(
     num_results: int = 20,
     audible_region: audible_region_type | None = None,
     exclude_requested_username: str | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    requested_asins: set[str] | None = None,
 ) -> list[AudiobookWithRequests]:
+    if not search_terms:
+        # e.g. no popular authors/narrators yet
+        return []
+
     all_books: list[Audiobook] = []
+    seen_asins: set[str] = set()
     books_per_term = max(1, num_results // len(search_terms))
 
-    if exclude_requested_username:
-        requested_asins = set(
-            session.exec(
-                select(AudiobookRequest.asin).where(
-                    AudiobookRequest.user_username == exclude_requested_username
-                )
-            ).all()
-        )
-    else:
-        requested_asins = set[str]()
+    if requested_asins is None:
+        requested_asins = _get_requested_asins(session, exclude_requested_username)
 
-    for term in search_terms:
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SEARCHES)
+
+    async def _search_term(term: str) -> list[Audiobook]:
         logger.debug("Searching for term", term=term)
         try:
-            # Use the existing search function
-            term_books = await search_audible_books(
-                client_session=client_session,
-                query=term,
-                num_results=books_per_term,
-                page=0,
-                audible_region=audible_region,
-            )
-
-            # Add unique books only
-            for book in term_books:
-                if (
-                    book.asin not in requested_asins
-                    and book not in all_books
-                    and len(all_books) < num_results
-                ):
-                    all_books.append(book)
-
-            logger.debug(
-                "Found books for term",
-                term=term,
-                found=len(term_books),
-                total_collected=len(all_books),
-            )
-            if len(all_books) >= num_results:
-                break
+            async with semaphore:
+                # Use the existing search function
+                return await search_audible_books(
+                    client_session=client_session,
+                    query=term,
+                    num_results=books_per_term,
+                    page=0,
+                    audible_region=audible_region,
+                )
         except Exception as e:
             logger.warning("Failed to search for popular term", term=term, error=str(e))
-            continue
+            return []
+
+    # terms are searched concurrently, but the results are combined in term order
+    results = await asyncio.gather(*[_search_term(term) for term in search_terms])
+    for term, term_books in zip(search_terms, results):
+        # Add unique books only
+        for book in term_books:
+            if (
+                book.asin not in requested_asins
+                and book.asin not in seen_asins
+                and len(all_books) < num_results
+            ):
+                all_books.append(book)
+                seen_asins.add(book.asin)
+
+        logger.debug(
+            "Found books for term",
+            term=term,
+            found=len(term_books),
+            total_collected=len(all_books),
+        )
+        if len(all_books) >= num_results:
+            break
 
     logger.info(
         "Fetched popular books using search terms",
@@ -104,15 +126,28 @@ async def list_category_audible_books(
     }
 
     recommendations: dict[str, list[AudiobookWithRequests]] = {}
+    # shared by all categories, so the total amount of concurrent searches is bounded
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SEARCHES)
+    # the user's requests are the same for all categories
+    requested_asins = _get_requested_asins(session, excluded_requested_username)
 
     async def _fetch_category(category_name: str):
-        books = await list_combined_audible_books(
-            session,
-            client_session,
-            categories[category_name],
-            audible_region=audible_region,
-            exclude_requested_username=excluded_requested_username,
-        )
+        try:
+            books = await list_combined_audible_books(
+                session,
+                client_session,
+                categories[category_name],
+                audible_region=audible_region,
+                exclude_requested_username=excluded_requested_username,
+                semaphore=semaphore,
+                requested_asins=requested_asins,
+            )
+        except Exception as e:
+            # a failing category is left out instead of failing all the others
+            logger.warning(
+                "Failed to fetch category", category=category_name, error=str(e)
+            )
+            return
 
         recommendations[category_name] = books
 
@@ -121,9 +156,4 @@ async def list_category_audible_books(
         coros.append(_fetch_category(category_name))
     await asyncio.gather(*coros)
 
-    for _, v in recommendations.items():
-        for b in v:
-            for r in b.book.requests:
-                session.refresh(r)
-
     return recommendations
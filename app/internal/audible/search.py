@@ -15,6 +15,7 @@ from app.internal.audible.types import (
     get_region_from_settings,
 )
 from app.internal.models import Audiobook, AudiobookRequest
+from app.util.cache import InFlight
 from app.util.log import logger
 
 
@@ -45,6 +46,7 @@ class CacheResult[T](BaseModel, frozen=True):
 # simple caching of search results to avoid having to fetch from audible so frequently
 search_cache: dict[CacheQuery, CacheResult[list[Audiobook]]] = {}
 search_suggestions_cache: dict[str, CacheResult[list[str]]] = {}
+search_in_flight = InFlight[list[Audiobook], CacheQuery]()
 
 
 class _AudibleSuggestionsResponse(BaseModel):
@@ -108,8 +110,8 @@ async def get_search_suggestions(
             params=params,
         ) as response:
             response.raise_for_status()
-            suggestions = _AudibleSuggestionsResponse.model_validate(
-                await response.json()
+            suggestions = _AudibleSuggestionsResponse.model_validate_json(
+                await response.read()
             )
     except Exception as e:
         logger.error(
@@ -155,14 +157,26 @@ async def search_audible_books(
     if cache_result and time.time() - cache_result.timestamp < REFETCH_TTL:
         return cache_result.value
 
+    # concurrent searches for the same query (e.g. overlapping category terms) share
+    # a single request to Audible
+    return await search_in_flight.run(
+        lambda: _fetch_audible_books(client_session, cache_key), cache_key
+    )
+
+
+async def _fetch_audible_books(
+    client_session: ClientSession, cache_key: CacheQuery
+) -> list[Audiobook]:
+    query = cache_key.query
+    audible_region = cache_key.audible_region
     base_url = (
         f"https://api.audible{audible_regions[audible_region]}/1.0/catalog/products"
     )
     params = {
-        "num_results": num_results,
+        "num_results": cache_key.num_results,
         "products_sort_by": "Relevance",
         "keywords": query,
-        "page": page,
+        "page": cache_key.page,
         "response_groups": ["media"],
     }
 
@@ -172,8 +186,8 @@ async def search_audible_books(
             params=params,
         ) as response:
             response.raise_for_status()
-            audible_response = AudibleSearchResponse.model_validate(
-                await response.json()
+            audible_response = AudibleSearchResponse.model_validate_json(
+                await response.read()
             )
     except Exception as e:
         logger.error(
@@ -2,7 +2,7 @@ import time
 
 from aiohttp import ClientSession
 from pydantic import BaseModel
-from sqlmodel import Session
+from sqlmodel import Session, col, select
 
 from app.internal.audible.search import CacheResult, search_audible_books
 from app.internal.audible.single import get_single_book
@@ -14,17 +14,21 @@ from app.internal.audible.types import (
     get_region_from_settings,
 )
 from app.internal.models import Audiobook
+from app.util.cache import InFlight
 from app.util.log import logger
 
 
 class _SimsCacheKey(BaseModel, frozen=True):
     type: str = "popular"
-    region: str
+    region: audible_region_type
     num_results: int
     asin: str
 
 
 sims_cache: dict[_SimsCacheKey, CacheResult[list[Audiobook]]] = {}
+# every visited book adds an entry, so the cache is capped on top of the TTL
+_SIMS_CACHE_MAX_SIZE = 4096
+sims_in_flight = InFlight[list[Audiobook], _SimsCacheKey]()
 
 
 async def list_similar_audible_books(
@@ -46,11 +50,33 @@ async def list_similar_audible_books(
     cache_key = _SimsCacheKey(region=audible_region, num_results=num_results, asin=asin)
     cache_result = sims_cache.get(cache_key)
     if cache_result and time.time() - cache_result.timestamp < REFETCH_TTL:
+        # Load the stored books in one query first, so merging them into the current
+        # session finds them in the identity map instead of selecting one at a time
+        session.exec(
+            select(Audiobook).where(
+                col(Audiobook.asin).in_([book.asin for book in cache_result.value])
+            )
+        ).all()
         # Merge cached ORM instances into the current session to avoid cross-session attachment errors
         merged = [session.merge(book) for book in cache_result.value]
         logger.debug("Using cached popular books", region=audible_region)
         return merged
 
+    # recommendations of different users often share seeds, so concurrent lookups of
+    # the same book only send a single request
+    return await sims_in_flight.run(
+        lambda: _fetch_similar_books(session, client_session, cache_key), cache_key
+    )
+
+
+async def _fetch_similar_books(
+    session: Session,
+    client_session: ClientSession,
+    cache_key: _SimsCacheKey,
+) -> list[Audiobook]:
+    asin = cache_key.asin
+    num_results = cache_key.num_results
+    audible_region = cache_key.region
     base_url = f"https://api.audible{audible_regions[audible_region]}/1.0/catalog/products/{asin}/sims"
     params = {
         "num_results": min(10, max(1, num_results)),  # audible limits to max 10
@@ -61,7 +87,7 @@ async def list_similar_audible_books(
     try:
         async with client_session.get(base_url, params=params) as response:
             response.raise_for_status()
-            sims = AudibleSimilarResponse.model_validate(await response.json())
+            sims = AudibleSimilarResponse.model_validate_json(await response.read())
 
         ordered = sims.audiobooks()
     except Exception as e:
@@ -101,5 +127,16 @@ async def list_similar_audible_books(
         except Exception:
             ordered = []
 
-    sims_cache[cache_key] = CacheResult(value=ordered, timestamp=time.time())
+    now = time.time()
+    # re-inserted so the dict stays ordered from oldest to newest entry
+    sims_cache.pop(cache_key, None)
+    sims_cache[cache_key] = CacheResult(value=ordered, timestamp=now)
+
+    # clean up cache slightly
+    for k in list(sims_cache.keys()):
+        if now - sims_cache[k].timestamp > REFETCH_TTL:
+            sims_cache.pop(k, None)
+    while len(sims_cache) > _SIMS_CACHE_MAX_SIZE:
+        sims_cache.pop(next(iter(sims_cache)), None)
+
     return ordered
@@ -27,5 +27,5 @@ async def get_single_book(
         params=params,
     ) as response:
         response.raise_for_status()
-        product = AudibleSingleResponse.model_validate(await response.json())
+        product = AudibleSingleResponse.model_validate_json(await response.read())
         return product.product.to_audiobook()
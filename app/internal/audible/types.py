@@ -1,5 +1,6 @@
 from abc import ABCMeta, abstractmethod
 from datetime import datetime
+from functools import cache
 from typing import Literal
 
 from pydantic import BaseModel
@@ -38,6 +39,8 @@ audible_regions: dict[audible_region_type, str] = {
 }
 
 
+# the settings can't change at runtime and this is used for every Audible request
+@cache
 def get_region_from_settings() -> audible_region_type:
     region = Settings().app.default_region
     if region not in audible_regions:
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import posixpath
-import re
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Literal
 
 from aiohttp import ClientSession
@@ -18,8 +19,9 @@ from app.internal.audiobookshelf.types import (
     ABSPodcastItem,
 )
 from app.internal.models import Audiobook
-from app.util.connection import USER_AGENT
-from app.util.db import get_session
+from app.util.cache import SimpleCache
+from app.util.connection import USER_AGENT, get_shared_session
+from app.util.db import session_scope
 from app.util.log import logger
 
 
@@ -29,6 +31,29 @@ def _headers(session: Session) -> dict[str, str]:
     return {"Authorization": f"Bearer {token}", "User-Agent": USER_AGENT}
 
 
+@dataclass(frozen=True)
+class _ABSContext:
+    """ABS settings looked up once and reused for a batch of requests."""
+
+    base_url: str
+    library_id: str
+    headers: dict[str, str]
+    search_url: str
+
+
+def _get_context(session: Session) -> _ABSContext | None:
+    base_url = abs_config.get_base_url(session)
+    lib_id = abs_config.get_library_id(session)
+    if not base_url or not lib_id or not abs_config.get_api_token(session):
+        return None
+    return _ABSContext(
+        base_url=base_url,
+        library_id=lib_id,
+        headers=_headers(session),
+        search_url=posixpath.join(base_url, f"api/libraries/{lib_id}/search"),
+    )
+
+
 class _LibraryArray(BaseModel):
     libraries: list[ABSLibrary] = []
 
@@ -49,7 +74,7 @@ async def abs_get_libraries(
                     reason=resp.reason,
                 )
                 return []
-            data = _LibraryArray.model_validate(await resp.json())
+            data = _LibraryArray.model_validate_json(await resp.read())
             return data.libraries
     except Exception as e:
         logger.error("ABS: exception fetching libraries", error=str(e))
@@ -73,13 +98,26 @@ async def abs_trigger_scan(session: Session, client_session: ClientSession) -> b
 
 
 async def background_abs_trigger_scan():
-    with next(get_session()) as session:
-        async with ClientSession() as client_session:
+    try:
+        with session_scope() as session:
             logger.debug("ABS: running background library scan trigger")
-            success = await abs_trigger_scan(session, client_session)
+            success = await abs_trigger_scan(session, get_shared_session())
             logger.info(
                 "ABS: background library scan trigger complete", success=success
             )
+    except Exception as e:
+        logger.error("ABS: background library scan trigger failed", error=str(e))
+
+
+# strong references so running scan tasks aren't garbage collected
+_scan_tasks: set[asyncio.Task[None]] = set()
+
+
+def schedule_abs_trigger_scan():
+    """Trigger a library scan without waiting on ABS to respond."""
+    task = asyncio.create_task(background_abs_trigger_scan())
+    _scan_tasks.add(task)
+    task.add_done_callback(_scan_tasks.discard)
 
 
 class _ListResponseBook(BaseModel):
@@ -130,7 +168,7 @@ async def abs_list_library_items(
                     reason=resp.reason,
                 )
                 return []
-            payload = _ListResponse.validate_python(await resp.json())
+            payload = _ListResponse.validate_json(await resp.read())
             if payload.mediaType == "podcast":
                 logger.warning(
                     "ABS: podcasts not supported in library listing", lib_id=lib_id
@@ -202,43 +240,91 @@ class _BookSearchResult(BaseModel):
     book: list[_LibraryItem] | None = None
 
 
+# (base_url, library_id, query) -> search results. Kept short since the library
+# changes whenever a download finishes.
+_SEARCH_CACHE_TTL = 5 * 60
+abs_search_cache = SimpleCache[list[ABSBookItem], str, str, str]()
+
+
 async def _abs_search(
-    session: Session, client_session: ClientSession, query: str
+    ctx: _ABSContext, client_session: ClientSession, query: str
 ) -> list[ABSBookItem]:
-    base_url = abs_config.get_base_url(session)
-    lib_id = abs_config.get_library_id(session)
-    if not base_url or not lib_id:
-        return []
-    url = posixpath.join(base_url, f"api/libraries/{lib_id}/search")
+    base_url = ctx.base_url
+    lib_id = ctx.library_id
+
+    cached = abs_search_cache.get(_SEARCH_CACHE_TTL, base_url, lib_id, query)
+    if cached is not None:
+        return cached
+
     try:
         async with client_session.get(
-            url, headers=_headers(session), params={"q": query}
+            ctx.search_url, headers=ctx.headers, params={"q": query}
         ) as resp:
             if not resp.ok:
                 logger.debug(
                     "ABS: search failed", status=resp.status, reason=resp.reason
                 )
                 return []
-            data = _BookSearchResult.model_validate(await resp.json())
+            data = _BookSearchResult.model_validate_json(await resp.read())
+            items: list[ABSBookItem] = []
             if data.book is None:
                 logger.warning(
                     "ABS: search returned no book results", query=query, lib_id=lib_id
                 )
-                return []
-            return [it.libraryItem for it in data.book]
+            else:
+                items = [it.libraryItem for it in data.book]
+            # only successful responses are cached, failures are retried next time
+            abs_search_cache.set(items, base_url, lib_id, query)
+            return items
     except Exception as e:
         logger.debug("ABS: exception during search", error=str(e))
         return []
 
 
+_NORMALIZE_KEEP = "abcdefghijklmnopqrstuvwxyz0123456789"
+
+
+class _NormalizeTable(dict[int, int]):
+    """Translation table mapping everything except [a-z0-9] to a space. Filled lazily."""
+
+    def __missing__(self, key: int) -> int:
+        value = key if chr(key) in _NORMALIZE_KEEP else 32
+        self[key] = value
+        return value
+
+
+_NORMALIZE_TABLE = _NormalizeTable()
+# Byte table for ASCII input that also takes care of lowercasing
+_NORMALIZE_ASCII_TABLE = bytes(
+    ord(c.lower()) if c.lower() in _NORMALIZE_KEEP else 32 for c in map(chr, range(256))
+)
+
+
+# The same ABS results get checked repeatedly while they're cached, so remember
+# the normalized strings as well
+@lru_cache(maxsize=4096)
 def _normalize(s: str) -> str:
-    s = s.lower().strip()
-    s = re.sub(r"[^a-z0-9]+", " ", s)
-    return re.sub(r"\s+", " ", s).strip()
+    # split() collapses and strips the spaces in one go
+    if s.isascii():
+        return b" ".join(s.encode().translate(_NORMALIZE_ASCII_TABLE).split()).decode()
+    return " ".join(s.lower().translate(_NORMALIZE_TABLE).split())
+
+
+def _matches_book(it: ABSBookItem, norm_title: str, norm_authors: set[str]) -> bool:
+    # ABS search returns different shapes, try best-effort
+    title = it.media.metadata.title
+    if not title:
+        logger.debug("ABS: search result missing title", item=it)
+        return False
+    if _normalize(title) != norm_title:
+        return False
+    return not norm_authors or not norm_authors.isdisjoint(
+        _normalize(a.name) for a in it.media.metadata.authors
+    )
 
 
 async def abs_book_exists(
-    session: Session,
+    ctx: _ABSContext,
     client_session: ClientSession,
     book: Audiobook,
 ) -> bool:
@@ -248,19 +334,22 @@ async def abs_book_exists(
     # Try ASIN first
     candidates: list[ABSBookItem] = []
     if book.asin:
-        candidates = await _abs_search(session, client_session, book.asin)
+        candidates = await _abs_search(ctx, client_session, book.asin)
         logger.debug(
             "ABS: ASIN search results",
             asin=book.asin,
             candidate_count=len(candidates),
         )
+        # an exact ASIN match is the same book, no need to compare titles and authors
+        if any(it.media.metadata.asin == book.asin for it in candidates):
+            return True
     if not candidates:
         logger.debug(
             "ABS: ASIN search yielded no results. Checking with title",
             asin=book.asin,
         )
         q = f"{book.title}".strip()
-        candidates = await _abs_search(session, client_session, q)
+        candidates = await _abs_search(ctx, client_session, q)
 
     if not candidates:
         return False
@@ -268,19 +357,7 @@ async def abs_book_exists(
     norm_title = _normalize(book.title)
     norm_authors = {_normalize(a) for a in book.authors}
 
-    for it in candidates:
-        # ABS search returns different shapes, try best-effort
-        title = it.media.metadata.title
-        if not title:
-            logger.debug("ABS: search result missing title", item=it)
-            continue
-        authors = it.media.metadata.authors
-        if _normalize(title) == norm_title:
-            if not norm_authors or any(
-                _normalize(a.name) in norm_authors for a in authors
-            ):
-                return True
-    return False
+    return any(_matches_book(it, norm_title, norm_authors) for it in candidates)
 
 
 async def abs_mark_downloaded_flags(
@@ -290,14 +367,20 @@ async def abs_mark_downloaded_flags(
 ) -> None:
     if not abs_config.get_check_downloaded(session):
         return
+    ctx = _get_context(session)
+    if ctx is None:
+        return
     # Only check books not already marked downloaded
     to_check = [b for b in books if not b.downloaded]
     # Limit to avoid flooding ABS
     to_check = to_check[:25]
+    # Bound the number of concurrent searches so ABS isn't hit with all of them at once
+    semaphore = asyncio.Semaphore(4)
 
     async def _check_and_mark(b: Audiobook):
         try:
-            exists = await abs_book_exists(session, client_session, b)
+            async with semaphore:
+                exists = await abs_book_exists(ctx, client_session, b)
             logger.debug("ABS: exist check", asin=b.asin, exists=exists)
             if exists:
                 b.downloaded = True
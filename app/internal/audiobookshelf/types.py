@@ -36,6 +36,7 @@ class ABSBook(BaseModel):
             name: str
 
         authors: list[_Author]
+        asin: str | None = None
 
     metadata: _Metadata
 
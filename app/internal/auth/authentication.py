@@ -387,3 +387,12 @@ class AnyAuth(SecurityBase):
                 detail="Authentication required",
             )
         return None
+
+
+# shared dependency instances, so each route reuses the same auth check
+abr_auth = ABRAuth()
+abr_auth_trusted = ABRAuth(GroupEnum.trusted)
+abr_auth_admin = ABRAuth(GroupEnum.admin)
+any_auth = AnyAuth()
+any_auth_trusted = AnyAuth(GroupEnum.trusted)
+any_auth_admin = AnyAuth(GroupEnum.admin)
@@ -27,28 +27,25 @@ def get_wishlist_counts(session: Session, user: User | None = None) -> WishlistC
     """
     username = None if user is None or user.is_admin() else user.username
 
-    rows = session.exec(
-        select(Audiobook.downloaded, func.count("*"))
-        .where(not username or AudiobookRequest.user_username == username)
-        .select_from(Audiobook)
-        .join(AudiobookRequest)
-        .group_by(col(Audiobook.downloaded))
-    ).all()
-    requests = 0
-    downloaded = 0
-    for downloaded_status, count in rows:
-        if downloaded_status:
-            downloaded = count
-        else:
-            requests = count
-
-    manual = session.exec(
+    manual_count = (
         select(func.count())
         .select_from(ManualBookRequest)
         .where(
             not username or ManualBookRequest.user_username == username,
             col(ManualBookRequest.user_username).is_not(None),
         )
+        .scalar_subquery()
+    )
+    # all three counts in a single round trip
+    requests, downloaded, manual = session.exec(
+        select(
+            func.count().filter(not_(Audiobook.downloaded)),
+            func.count().filter(col(Audiobook.downloaded)),
+            manual_count,
+        )
+        .where(not username or AudiobookRequest.user_username == username)
+        .select_from(Audiobook)
+        .join(AudiobookRequest)
     ).one()
 
     return WishlistCounts(
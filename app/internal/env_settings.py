@@ -33,6 +33,9 @@ class ApplicationSettings(BaseModel):
     default_region: str = "us"
     """Default region used in the search"""
 
+    max_recommendation_seeds: int = 25
+    """Maximum amount of the most recently requested books of a user used as seeds for the personalized recommendations"""
+
     force_login_type: str = ""
     """Forces the login type used. If set, the login type cannot be changed in the UI."""
 
@@ -5,7 +5,7 @@ from enum import Enum
 from typing import Annotated, Literal, Union, cast
 
 from pydantic import BaseModel, ConfigDict
-from sqlmodel import JSON, Column, DateTime, Field, SQLModel, func
+from sqlmodel import JSON, Column, DateTime, Field, Index, SQLModel, func
 from sqlmodel._compat import SQLModelConfig
 from sqlmodel.main import Relationship
 
@@ -107,6 +107,16 @@ class AudiobookWithRequests(BaseModel):
 
 
 class AudiobookRequest(BaseSQLModel, table=True):
+    # speed up the latest request lookups per book and per user
+    __table_args__ = (
+        Index("ix_audiobookrequest_asin_updated_at", "asin", "updated_at"),
+        Index(
+            "ix_audiobookrequest_user_username_updated_at",
+            "user_username",
+            "updated_at",
+        ),
+    )
+
     asin: str = Field(
         primary_key=True,
         foreign_key="audiobook.asin",
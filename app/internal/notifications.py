@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 from aiohttp import ClientSession, InvalidUrlClientError
@@ -12,7 +13,8 @@ from app.internal.models import (
     User,
 )
 from app.util import json_type
-from app.util.db import get_session
+from app.util.connection import get_shared_session
+from app.util.db import session_scope
 from app.util.log import logger
 
 PLACEHOLDER_COVER_URL = "https://picsum.photos/id/24/500/500"
@@ -102,9 +104,7 @@ async def send_notification(
     book_cover = None
     requesters: list[User] | None = None
     if book_asin:
-        book = session.exec(
-            select(Audiobook).where(Audiobook.asin == book_asin)
-        ).first()
+        book = session.get(Audiobook, book_asin)
         if book:
             book_title = book.title
             book_authors = ",".join(book.authors)
@@ -136,8 +136,7 @@ async def send_notification(
     )
 
     try:
-        async with ClientSession() as client_session:
-            resp = await _send(body, notification, client_session)
+        resp = await _send(body, notification, get_shared_session())
         logger.info(
             "Individual notification sent successfully",
             url=notification.url,
@@ -161,19 +160,25 @@ async def send_all_notifications(
 ):
     if other_replacements is None:
         other_replacements = {}
-    with next(get_session()) as session:
+    with session_scope() as session:
         notifications = session.exec(
             select(Notification).where(
                 Notification.event == event_type, Notification.enabled
             )
         ).all()
-        for notification in notifications:
-            await send_notification(
-                session=session,
-                notification=notification,
-                book_asin=book_asin,
-                other_replacements=other_replacements,
-            )
+        # failures are logged by send_notification and shouldn't stop the others
+        await asyncio.gather(
+            *[
+                send_notification(
+                    session=session,
+                    notification=notification,
+                    book_asin=book_asin,
+                    other_replacements=other_replacements,
+                )
+                for notification in notifications
+            ],
+            return_exceptions=True,
+        )
 
 
 async def send_manual_notification(
@@ -211,8 +216,7 @@ async def send_manual_notification(
             headers=notification.headers,
         )
 
-        async with ClientSession() as client_session:
-            return await _send(body, notification, client_session)
+        return await _send(body, notification, get_shared_session())
 
     except Exception as e:
         logger.error("Failed to send manual notification", error=str(e))
@@ -226,19 +230,21 @@ async def send_all_manual_notifications(
 ):
     if other_replacements is None:
         other_replacements = {}
-    with next(get_session()) as session:
-        user = session.exec(
-            select(User).where(User.username == book_request.user_username)
-        ).first()
+    with session_scope() as session:
+        user = session.get(User, book_request.user_username)
         notifications = session.exec(
             select(Notification).where(
                 Notification.event == event_type, Notification.enabled
             )
         ).all()
-        for notif in notifications:
-            await send_manual_notification(
-                notification=notif,
-                book=book_request,
-                requester=user,
-                other_replacements=other_replacements,
-            )
+        await asyncio.gather(
+            *[
+                send_manual_notification(
+                    notification=notif,
+                    book=book_request,
+                    requester=user,
+                    other_replacements=other_replacements,
+                )
+                for notif in notifications
+            ]
+        )
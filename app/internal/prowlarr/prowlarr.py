@@ -1,15 +1,22 @@
+import asyncio
 import html
 import json
 import posixpath
+import random
 import time
 import uuid
 from datetime import datetime
 from typing import Literal
 from urllib.parse import urlencode
 
-from aiohttp import ClientResponse, ClientSession
+from aiohttp import (
+    ClientConnectorError,
+    ClientResponse,
+    ClientSession,
+    ClientTimeout,
+)
 from pydantic import BaseModel, TypeAdapter
-from sqlmodel import Session, select
+from sqlmodel import Session, col, update
 from torf import BdecodeError, MetainfoError, ReadError, Torrent
 
 from app.internal.indexers.abstract import SessionContainer
@@ -58,6 +65,67 @@ async def _get_torrent_info_hash(
             )
 
 
+_DOWNLOAD_ATTEMPTS = 3
+_DOWNLOAD_RETRY_DELAY = 0.5
+# the whole grab, including all retries, has to finish within this time
+_DOWNLOAD_TIMEOUT = 30
+_DOWNLOAD_CONNECT_TIMEOUT = 5
+# only returned by a proxy in front of Prowlarr, meaning the grab never reached it
+_PROXY_RETRY_STATUSES = {502, 503, 504}
+
+
+async def _post_with_retry(
+    client_session: ClientSession,
+    url: str,
+    body: bytes,
+    headers: dict[str, str],
+) -> ClientResponse:
+    """
+    POSTs to Prowlarr, retrying with exponential backoff only if the request can't
+    have reached Prowlarr: the connection couldn't be opened or a proxy answered with
+    502/503/504. A grab isn't idempotent, so timeouts and disconnects after the
+    request was sent are never retried. The response body is read before returning
+    so it can still be accessed afterwards.
+    """
+    deadline = time.monotonic() + _DOWNLOAD_TIMEOUT
+    attempt = 0
+    while True:
+        attempt += 1
+        timeout = ClientTimeout(
+            total=max(deadline - time.monotonic(), _DOWNLOAD_CONNECT_TIMEOUT),
+            sock_connect=_DOWNLOAD_CONNECT_TIMEOUT,
+        )
+        error: ClientConnectorError | None = None
+        response: ClientResponse | None = None
+        try:
+            async with client_session.post(
+                url, data=body, headers=headers, timeout=timeout
+            ) as response:
+                await response.read()
+        except ClientConnectorError as e:
+            error = e
+
+        delay = _DOWNLOAD_RETRY_DELAY * 2 ** (attempt - 1) + random.uniform(0, 0.3)
+        last_attempt = (
+            attempt >= _DOWNLOAD_ATTEMPTS
+            or time.monotonic() + delay + _DOWNLOAD_CONNECT_TIMEOUT >= deadline
+        )
+        if response is not None and (
+            last_attempt or response.status not in _PROXY_RETRY_STATUSES
+        ):
+            return response
+        if error is not None and last_attempt:
+            raise error
+
+        logger.warning(
+            "Prowlarr request failed, retrying",
+            attempt=attempt,
+            status=response.status if response else None,
+            error=str(error) if error else None,
+        )
+        await asyncio.sleep(delay)
+
+
 async def start_download(
     *,
     session: Session,
@@ -74,7 +142,12 @@ async def start_download(
 
     url = posixpath.join(base_url, "api/v1/search")
     logger.debug("Starting download", guid=guid)
-    headers = {"X-Api-Key": api_key, "User-Agent": USER_AGENT}
+    headers = {
+        "X-Api-Key": api_key,
+        "User-Agent": USER_AGENT,
+        "Content-Type": "application/json",
+    }
+    body = json.dumps({"guid": guid, "indexerId": indexer_id}).encode()
 
     manual_book_request: ManualBookRequest | None = None
     try:
@@ -83,86 +156,82 @@ async def start_download(
     except ValueError:
         pass
 
-    async with client_session.post(
-        url,
-        json={"guid": guid, "indexerId": indexer_id},
-        headers=headers,
-    ) as response:
-        if not response.ok:
-            logger.error(
-                "Failed to start download",
-                guid=guid,
-                response=response,
-                text=await response.text(),
-            )
-
-            if manual_book_request:
-                await send_all_manual_notifications(
-                    EventEnum.on_failed_download,
-                    manual_book_request,
-                    {
-                        "errorStatus": str(response.status),
-                        "errorReason": response.reason or "<unknown>",
-                    },
-                )
-            else:
-                await send_all_notifications(
-                    EventEnum.on_failed_download,
-                    asin_or_uuid,
-                    {
-                        "errorStatus": str(response.status),
-                        "errorReason": response.reason or "<unknown>",
-                    },
-                )
-            return response
-
-        # Find additional metadata/replacements to pass along notifications
-        additional_replacements: dict[str, str] = (
-            {"bookASIN": asin_or_uuid} if asin_or_uuid else {}
+    response = await _post_with_retry(client_session, url, body, headers)
+    if not response.ok:
+        logger.error(
+            "Failed to start download",
+            guid=guid,
+            response=response,
+            text=await response.text(),
         )
-        if prowlarr_source:
-            if prowlarr_source.download_url and prowlarr_source.protocol == "torrent":
-                if info_hash := await _get_torrent_info_hash(
-                    client_session, prowlarr_source.download_url
-                ):
-                    additional_replacements["torrentInfoHash"] = info_hash
-            elif prowlarr_source.magnet_url and prowlarr_source.protocol == "torrent":
-                info_hash = prowlarr_source.magnet_url.replace("magnet:?", "")
-                info_hash = info_hash.replace("xt=urn:btih:", "")
-                info_hash = info_hash.split("&")[0]
-                additional_replacements["torrentInfoHash"] = info_hash
 
-            additional_replacements["sourceSizeMB"] = str(prowlarr_source.size_MB)
-            additional_replacements["sourceTitle"] = prowlarr_source.title
-            additional_replacements["indexerName"] = prowlarr_source.indexer
-            additional_replacements["sourceProtocol"] = prowlarr_source.protocol
-
-        logger.debug("Download successfully started", guid=guid)
         if manual_book_request:
-            manual_book_request.downloaded = True
-            session.add(manual_book_request)
-            session.commit()
             await send_all_manual_notifications(
-                EventEnum.on_successful_download,
+                EventEnum.on_failed_download,
                 manual_book_request,
-                additional_replacements,
+                {
+                    "errorStatus": str(response.status),
+                    "errorReason": response.reason or "<unknown>",
+                },
             )
         else:
-            same_books = session.exec(
-                select(Audiobook).where(Audiobook.asin == asin_or_uuid)
-            ).all()
-            for b in same_books:
-                b.downloaded = True
-                session.add(b)
-
             await send_all_notifications(
-                EventEnum.on_successful_download,
+                EventEnum.on_failed_download,
                 asin_or_uuid,
-                additional_replacements,
+                {
+                    "errorStatus": str(response.status),
+                    "errorReason": response.reason or "<unknown>",
+                },
             )
-
         return response
 
+    # Find additional metadata/replacements to pass along notifications
+    additional_replacements: dict[str, str] = (
+        {"bookASIN": asin_or_uuid} if asin_or_uuid else {}
+    )
+    if prowlarr_source:
+        if prowlarr_source.download_url and prowlarr_source.protocol == "torrent":
+            if info_hash := await _get_torrent_info_hash(
+                client_session, prowlarr_source.download_url
+            ):
+                additional_replacements["torrentInfoHash"] = info_hash
+        elif prowlarr_source.magnet_url and prowlarr_source.protocol == "torrent":
+            info_hash = prowlarr_source.magnet_url.replace("magnet:?", "")
+            info_hash = info_hash.replace("xt=urn:btih:", "")
+            info_hash = info_hash.split("&")[0]
+            additional_replacements["torrentInfoHash"] = info_hash
+
+        additional_replacements["sourceSizeMB"] = str(prowlarr_source.size_MB)
+        additional_replacements["sourceTitle"] = prowlarr_source.title
+        additional_replacements["indexerName"] = prowlarr_source.indexer
+        additional_replacements["sourceProtocol"] = prowlarr_source.protocol
+
+    logger.debug("Download successfully started", guid=guid)
+    if manual_book_request:
+        manual_book_request.downloaded = True
+        session.add(manual_book_request)
+        session.commit()
+        await send_all_manual_notifications(
+            EventEnum.on_successful_download,
+            manual_book_request,
+            additional_replacements,
+        )
+    else:
+        session.execute(
+            update(Audiobook)
+            .where(col(Audiobook.asin) == asin_or_uuid)
+            .values(downloaded=True)
+        )
+        session.commit()
+
+        await send_all_notifications(
+            EventEnum.on_successful_download,
+            asin_or_uuid,
+            additional_replacements,
+        )
+
+    return response
+
 
 class _ProwlarrResultBase(BaseModel):
     guid: str
@@ -234,7 +303,7 @@ async def query_prowlarr(
 
     logger.info("Querying prowlarr", url=url)
     start_time = time.time()
-    prowlarr_text = None
+    prowlarr_body: bytes | None = None
 
     try:
         async with client_session.get(
@@ -244,16 +313,18 @@ async def query_prowlarr(
                 "Accept": "application/json",
                 "User-Agent": USER_AGENT,
             },
+            # searching through all indexers can take a while
+            timeout=ClientTimeout(60),
         ) as response:
-            prowlarr_text = await response.text()
+            # validated straight from the raw bytes, only decoded for error logs
+            prowlarr_body = await response.read()
             if not response.ok:
                 logger.error(
-                    "Prowlarr: Failed to query", response=await response.text()
+                    "Prowlarr: Failed to query",
+                    response=prowlarr_body.decode(errors="replace"),
                 )
                 return []
-            search_results = _ProwlarrSearchResult.validate_python(
-                await response.json()
-            )
+            search_results = _ProwlarrSearchResult.validate_json(prowlarr_body)
     except TimeoutError as e:
         elapsed_time = time.time() - start_time
         logger.error(
@@ -265,7 +336,9 @@ async def query_prowlarr(
         logger.error(
             "Failed to query Prowlarr",
             error=str(e),
-            prowlarr_response=prowlarr_text,
+            prowlarr_response=prowlarr_body.decode(errors="replace")
+            if prowlarr_body is not None
+            else None,
             elapsed_time=elapsed_time,
         )
         return []
@@ -390,7 +463,7 @@ async def get_indexers(
                     error=f"{response.status}: {response.reason}",
                 )
 
-            indexers = _IndexerList.validate_python(await response.json())
+            indexers = _IndexerList.validate_json(await response.read())
             for indexer in indexers:
                 prowlarr_indexer_cache.set(indexer, str(indexer.id))
             logger.info(
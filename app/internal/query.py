@@ -2,21 +2,23 @@ import uuid
 from contextlib import contextmanager
 from typing import Literal
 
-import aiohttp
 import pydantic
 from aiohttp import ClientSession
 from fastapi import HTTPException
 from sqlmodel import Session
 
-from app.internal.audiobookshelf.client import abs_trigger_scan
+from app.internal.audiobookshelf.client import schedule_abs_trigger_scan
 from app.internal.audiobookshelf.config import abs_config
 from app.internal.models import Audiobook, ManualBookRequest, ProwlarrSource
 from app.internal.prowlarr.prowlarr import query_prowlarr, start_download
 from app.internal.prowlarr.util import prowlarr_config
 from app.internal.ranking.download_ranking import rank_sources
-from app.util.db import get_session
+from app.util.connection import get_shared_session
+from app.util.db import session_scope
 from app.util.log import logger
 
+# Books that currently have a Prowlarr query running. This is only shared within a
+# single process, which is why ABR has to be run with a single worker.
 querying: set[str] = set()
 
 
@@ -100,10 +102,11 @@ async def query_sources(
                 prowlarr_source=ranked[0],
             )
             if resp.ok:
-                # Try to trigger an ABS scan to pick up new media
+                # Try to trigger an ABS scan to pick up new media, without blocking
+                # the response
                 try:
                     if abs_config.is_valid(session):
-                        await abs_trigger_scan(session, client_session)
+                        schedule_abs_trigger_scan()
                 except Exception:
                     logger.error("Failed to trigger ABS scan after starting download")
             else:
@@ -117,11 +120,10 @@ async def query_sources(
 
 
 async def background_start_query(asin_or_uuid: str, auto_download: bool):
-    with next(get_session()) as session:
-        async with ClientSession(timeout=aiohttp.ClientTimeout(60)) as client_session:
-            await query_sources(
-                asin_or_uuid=asin_or_uuid,
-                session=session,
-                client_session=client_session,
-                start_auto_download=auto_download,
-            )
+    with session_scope() as session:
+        await query_sources(
+            asin_or_uuid=asin_or_uuid,
+            session=session,
+            client_session=get_shared_session(),
+            start_auto_download=auto_download,
+        )
@@ -61,6 +61,12 @@ class CompareSource:
             self._compare_seeders,
             self._compare_age,
         ]
+        # Sorting compares every source many times. The fuzzy matches only depend on
+        # the source, so they're computed once per source (keyed by id) and reused.
+        self._title_matches: dict[int, bool] = {}
+        self._subtitle_matches: dict[int, bool] = {}
+        self._author_scores: dict[int, int] = {}
+        self._narrator_scores: dict[int, int] = {}
 
     def __call__(self, a: RankSource, b: RankSource):
         return self.compare(a, b)
@@ -108,54 +114,62 @@ class CompareSource:
         - Title match, OR
         - At least one author/narrator match
         """
-        title_ratio = quality_config.get_title_exists_ratio(self.session)
-        name_ratio = quality_config.get_name_exists_ratio(self.session)
-
-        # Check title match
-        title_match = exists_in_title(
-            self.book.title,
-            a.source.title,
-            title_ratio,
-        )
-
-        if title_match:
-            logger.debug(
-                "Title matches",
-                book_title=self.book.title,
-                source_title=a.source.title,
-                ratio=title_ratio,
-            )
+        if self._title_match(a.source):
             return True
-
-        # Check author/narrator match
-        author_score = max(
-            vaguely_exist_in_title(
-                self.book.authors,
-                a.source.title,
-                name_ratio,
-            ),
-            fuzzy_author_narrator_match(
-                a.source.book_metadata.authors,
-                self.book.authors,
-                name_ratio,
-            ),
-        )
-
-        narrator_score = max(
-            vaguely_exist_in_title(
-                self.book.narrators,
-                a.source.title,
-                name_ratio,
-            ),
-            fuzzy_author_narrator_match(
-                a.source.book_metadata.narrators,
-                self.book.narrators,
-                name_ratio,
-            ),
-        )
-
         # Require at least one author OR one narrator match
-        return author_score > 0 or narrator_score > 0
+        return self._author_score(a.source) > 0 or self._narrator_score(a.source) > 0
+
+    def _title_match(self, source: ProwlarrSource) -> bool:
+        key = id(source)
+        if (match := self._title_matches.get(key)) is None:
+            title_ratio = quality_config.get_title_exists_ratio(self.session)
+            match = exists_in_title(self.book.title, source.title, title_ratio)
+            if match:
+                logger.debug(
+                    "Title matches",
+                    book_title=self.book.title,
+                    source_title=source.title,
+                    ratio=title_ratio,
+                )
+            self._title_matches[key] = match
+        return match
+
+    def _subtitle_match(self, source: ProwlarrSource, subtitle: str) -> bool:
+        key = id(source)
+        if (match := self._subtitle_matches.get(key)) is None:
+            match = exists_in_title(
+                subtitle,
+                source.title,
+                quality_config.get_title_exists_ratio(self.session),
+            )
+            self._subtitle_matches[key] = match
+        return match
+
+    def _author_score(self, source: ProwlarrSource) -> int:
+        key = id(source)
+        if (score := self._author_scores.get(key)) is None:
+            name_ratio = quality_config.get_name_exists_ratio(self.session)
+            score = max(
+                vaguely_exist_in_title(self.book.authors, source.title, name_ratio),
+                fuzzy_author_narrator_match(
+                    source.book_metadata.authors, self.book.authors, name_ratio
+                ),
+            )
+            self._author_scores[key] = score
+        return score
+
+    def _narrator_score(self, source: ProwlarrSource) -> int:
+        key = id(source)
+        if (score := self._narrator_scores.get(key)) is None:
+            name_ratio = quality_config.get_name_exists_ratio(self.session)
+            score = max(
+                vaguely_exist_in_title(self.book.narrators, source.title, name_ratio),
+                fuzzy_author_narrator_match(
+                    source.book_metadata.narrators, self.book.narrators, name_ratio
+                ),
+            )
+            self._narrator_scores[key] = score
+        return score
 
     def _compare_valid(self, a: RankSource, b: RankSource, next_compare: int) -> int:
         """Filter out any reasons that make it not valid"""
@@ -220,16 +234,8 @@ class CompareSource:
         return a_index - b_index
 
     def _compare_title(self, a: RankSource, b: RankSource, next_compare: int) -> int:
-        a_title = exists_in_title(
-            self.book.title,
-            a.source.title,
-            quality_config.get_title_exists_ratio(self.session),
-        )
-        b_title = exists_in_title(
-            self.book.title,
-            b.source.title,
-            quality_config.get_title_exists_ratio(self.session),
-        )
+        a_title = self._title_match(a.source)
+        b_title = self._title_match(b.source)
         if a_title == b_title:
             return self._get_next_compare(next_compare)(a, b, next_compare + 1)
         return int(b_title) - int(a_title)
@@ -237,45 +243,15 @@ class CompareSource:
     def _compare_subtitle(self, a: RankSource, b: RankSource, next_compare: int) -> int:
         if not self.book.subtitle:
             return self._get_next_compare(next_compare)(a, b, next_compare + 1)
-        a_title = exists_in_title(
-            self.book.subtitle,
-            a.source.title,
-            quality_config.get_title_exists_ratio(self.session),
-        )
-        b_title = exists_in_title(
-            self.book.subtitle,
-            b.source.title,
-            quality_config.get_title_exists_ratio(self.session),
-        )
+        a_title = self._subtitle_match(a.source, self.book.subtitle)
+        b_title = self._subtitle_match(b.source, self.book.subtitle)
         if a_title == b_title:
             return self._get_next_compare(next_compare)(a, b, next_compare + 1)
         return int(b_title) - int(a_title)
 
     def _compare_authors(self, a: RankSource, b: RankSource, next_compare: int) -> int:
-        a_score = max(
-            vaguely_exist_in_title(
-                self.book.authors,
-                a.source.title,
-                quality_config.get_name_exists_ratio(self.session),
-            ),
-            fuzzy_author_narrator_match(
-                a.source.book_metadata.authors,
-                self.book.authors,
-                quality_config.get_name_exists_ratio(self.session),
-            ),
-        )
-        b_score = max(
-            vaguely_exist_in_title(
-                self.book.authors,
-                b.source.title,
-                quality_config.get_name_exists_ratio(self.session),
-            ),
-            fuzzy_author_narrator_match(
-                b.source.book_metadata.authors,
-                self.book.authors,
-                quality_config.get_name_exists_ratio(self.session),
-            ),
-        )
+        a_score = self._author_score(a.source)
+        b_score = self._author_score(b.source)
         if a_score == b_score:
             return self._get_next_compare(next_compare)(a, b, next_compare + 1)
         return b_score - a_score
@@ -283,30 +259,8 @@ class CompareSource:
     def _compare_narrators(
         self, a: RankSource, b: RankSource, next_compare: int
     ) -> int:
-        a_score = max(
-            vaguely_exist_in_title(
-                self.book.narrators,
-                a.source.title,
-                quality_config.get_name_exists_ratio(self.session),
-            ),
-            fuzzy_author_narrator_match(
-                a.source.book_metadata.narrators,
-                self.book.narrators,
-                quality_config.get_name_exists_ratio(self.session),
-            ),
-        )
-        b_score = max(
-            vaguely_exist_in_title(
-                self.book.narrators,
-                b.source.title,
-                quality_config.get_name_exists_ratio(self.session),
-            ),
-            fuzzy_author_narrator_match(
-                b.source.book_metadata.narrators,
-                self.book.narrators,
-                quality_config.get_name_exists_ratio(self.session),
-            ),
-        )
+        a_score = self._narrator_score(a.source)
+        b_score = self._narrator_score(b.source)
         if a_score == b_score:
             return self._get_next_compare(next_compare)(a, b, next_compare + 1)
         return b_score - a_score
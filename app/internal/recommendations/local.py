@@ -1,7 +1,10 @@
 from datetime import datetime, timedelta
-from typing import Counter, Sequence, cast
+from operator import itemgetter
+from typing import Counter, Literal, Sequence, cast
 
 from pydantic import BaseModel
+from sqlalchemy import Subquery, true
+from sqlalchemy.orm import InstrumentedAttribute, selectinload
 from sqlalchemy.sql.elements import KeyedColumnElement
 from sqlalchemy.sql.functions import count
 from sqlmodel import Session, col, func, select
@@ -9,6 +12,14 @@ from sqlmodel import Session, col, func, select
 from app.internal.models import Audiobook, AudiobookRequest, AudiobookWithRequests
 from app.util.log import logger
 
+# loads the requests of all returned books in a single query instead of one per book
+_load_requests = selectinload(
+    cast(
+        InstrumentedAttribute[list[AudiobookRequest]],
+        cast(object, Audiobook.requests),
+    )
+)
+
 
 class AudiobookPopularity(BaseModel):
     book: AudiobookWithRequests
@@ -49,6 +60,7 @@ def get_popular_books(
         .join(subquery, col(Audiobook.asin) == subquery.c.asin)
         .order_by(subquery.c.count.desc(), subquery.c.max_updated_at.desc())
         .limit(limit)
+        .options(_load_requests)
     )
 
     if exclude_downloaded:
@@ -65,22 +77,18 @@ def get_popular_books(
     results = session.exec(query).all()
     logger.debug(f"Popular books query returned {len(results)} results")
 
-    popular: list[AudiobookPopularity] = []
-    for book, request_count in results:
-        book_with_requests = AudiobookWithRequests(
-            book=book,
-            requests=book.requests,
-            username=exclude_requested_username,
-        )
-        popular.append(
-            AudiobookPopularity(
-                book=book_with_requests,
-                request_count=request_count,
-            )
+    # the values come straight from the database, so validation can be skipped
+    return [
+        AudiobookPopularity.model_construct(
+            book=AudiobookWithRequests(
+                book=book,
+                requests=book.requests,
+                username=exclude_requested_username,
+            ),
+            request_count=request_count,
         )
-        logger.debug(f"Popular book: {book.asin} (requests: {request_count})")
-
-    return popular
+        for book, request_count in results
+    ]
 
 
 def get_recently_requested_books(
@@ -93,16 +101,25 @@ def get_recently_requested_books(
     """Get recently requested books within the specified time frame."""
     cutoff_date = datetime.now() - timedelta(days=days_back)
 
-    query = (
-        select(Audiobook)
-        .join(AudiobookRequest)
+    # latest request per book, aggregated on the requests table alone
+    latest = (
+        select(
+            AudiobookRequest.asin,
+            func.max(col(AudiobookRequest.updated_at)).label("last_requested"),
+        )
         .where(
             AudiobookRequest.updated_at >= cutoff_date,
             AudiobookRequest.user_username != exclude_requested_username,
         )
-        .order_by(col(AudiobookRequest.updated_at).desc())
+        .group_by(AudiobookRequest.asin)
+    ).subquery()
+
+    query = (
+        select(Audiobook)
+        .join(latest, col(Audiobook.asin) == latest.c.asin)
+        .order_by(latest.c.last_requested.desc())
         .limit(limit)
-        .distinct()
+        .options(_load_requests)
     )
 
     if exclude_downloaded:
@@ -126,6 +143,34 @@ class AuthorNarrators(BaseModel):
     narrators: list[str]
 
 
+# functions expanding a JSON array column into one row per element, per dialect
+_JSON_ARRAY_ELEMENTS = {
+    "sqlite": func.json_each,
+    "postgresql": func.json_array_elements_text,
+}
+
+
+def _most_common_in_db(
+    session: Session,
+    books: Subquery,
+    column: Literal["authors", "narrators"],
+    limit: int,
+) -> list[str]:
+    """Counts the names inside the JSON array column directly in the database."""
+    array_elements = _JSON_ARRAY_ELEMENTS[session.get_bind().dialect.name]
+    names = array_elements(books.c[column]).table_valued("value")
+    amount = func.count().label("amount")
+    query = (
+        select(names.c.value, amount)
+        .select_from(books)
+        .join(names, true())
+        .group_by(names.c.value)
+        .order_by(amount.desc(), names.c.value)
+        .limit(limit)
+    )
+    return list(map(itemgetter(0), session.exec(query).all()))
+
+
 def get_most_popular_authors(
     session: Session,
     limit: int = 10,
@@ -134,21 +179,30 @@ def get_most_popular_authors(
 ) -> AuthorNarrators:
     """Get the most popular authors based on how many users have requested their books."""
 
-    query = select(Audiobook).join(AudiobookRequest).distinct()
+    requested = select(AudiobookRequest.asin)
+    if username:
+        requested = requested.where(AudiobookRequest.user_username == username)
+    # IN instead of a join with DISTINCT, since postgres can't compare json columns
+    query = select(Audiobook.authors, Audiobook.narrators).where(
+        col(Audiobook.asin).in_(requested)
+    )
     if exclude_downloaded:
         query = query.where(~col(Audiobook.downloaded))
-    if username:
-        query = query.where(AudiobookRequest.user_username == username)
-    audiobooks = session.exec(query).all()
+
+    if session.get_bind().dialect.name in _JSON_ARRAY_ELEMENTS:
+        books = query.subquery()
+        return AuthorNarrators(
+            authors=_most_common_in_db(session, books, "authors", limit),
+            narrators=_most_common_in_db(session, books, "narrators", limit),
+        )
+
     author_counter = Counter[str]()
     narrator_counter = Counter[str]()
-    for book in audiobooks:
-        author_counter.update(book.authors)
-        narrator_counter.update(book.narrators)
+    for authors, narrators in session.exec(query).all():
+        author_counter.update(authors)
+        narrator_counter.update(narrators)
 
-    popular_authors = author_counter.most_common(limit)
-    popular_narrators = narrator_counter.most_common(limit)
     return AuthorNarrators(
-        authors=[author for author, _ in popular_authors],
-        narrators=[narrator for narrator, _ in popular_narrators],
+        authors=list(map(itemgetter(0), author_counter.most_common(limit))),
+        narrators=list(map(itemgetter(0), narrator_counter.most_common(limit))),
     )
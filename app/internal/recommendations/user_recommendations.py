@@ -1,18 +1,26 @@
 import asyncio
-from collections import OrderedDict, defaultdict
+import heapq
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime
-from itertools import chain
-from typing import Counter, Iterable
+from itertools import chain, islice
+from typing import Callable, Counter, Iterable
 
 from aiohttp import ClientSession
 from pydantic import BaseModel
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.internal.audible.similar import list_similar_audible_books
+from app.internal.env_settings import Settings
 from app.internal.models import Audiobook, AudiobookRequest, AudiobookWithRequests, User
 from app.util.censor import censor
 from app.util.log import logger
 
+# Limits the amount of concurrent sims requests sent to Audible across all users.
+# The requests share the app-wide client session, so connections are reused.
+_sims_fetch_semaphore = asyncio.Semaphore(8)
+_max_seeds = Settings().app.max_recommendation_seeds
+
 
 class AudiobookRecommendation(BaseModel):
     book: AudiobookWithRequests
@@ -24,19 +32,43 @@ class UserSimsRecommendation(BaseModel):
     total: int
 
 
-class _BookScore(BaseModel):
+# internal scoring helpers are plain dataclasses, since pydantic validation is
+# too slow to run for every candidate
+@dataclass(slots=True)
+class _BookScore:
     book: Audiobook
     score: float
     count: int
     avg_rank: float
-    reason: str | None = None
+    recent: float
 
 
-class _RankedRecommendation(BaseModel):
+@dataclass(slots=True)
+class _RankedRecommendation:
     book: Audiobook
     rank: int
 
 
+def _rank_component(avg_idx: float) -> float:
+    # Convert average index to a 0..1 score (higher is better)
+    return 1.0 / (1.0 + avg_idx)
+
+
+def _pref_component(names: list[str], pref_get: Callable[[str, int], int]) -> float:
+    if not names:
+        return 0.0
+    return sum(pref_get(n, 0) for n in names) / max(1.0, len(names))
+
+
+def _recent_component(b: Audiobook, now: datetime) -> float:
+    try:
+        age_days = max(0.0, (now - b.release_date).days)
+        # Newer books get up to ~1.0 bonus, decaying over ~2 years
+        return max(0.0, 1.0 - (age_days / 730.0))
+    except Exception:
+        return 0.0
+
+
 async def get_user_sims_recommendations(
     session: Session,
     client_session: ClientSession,
@@ -59,11 +91,12 @@ async def get_user_sims_recommendations(
     - Exclude duplicates
     """
 
-    # Collect user's requested books as default seeds
+    # Collect user's requested books as default seeds, most recent first
     user_requests = session.exec(
         select(Audiobook)
         .join(AudiobookRequest)
         .where(AudiobookRequest.user_username == user.username)
+        .order_by(col(AudiobookRequest.updated_at).desc())
     ).all()
 
     # User preference profiles
@@ -73,10 +106,13 @@ async def get_user_sims_recommendations(
         user_authors.update(sim.authors)
         user_narrators.update(sim.narrators)
 
-    seeds = OrderedDict[str, None]()  # ordered set
+    seeds: dict[str, None] = {}  # ordered set
     if seed_asins:
-        seeds.update((asin, None) for asin in seed_asins)
-    seeds.update((b.asin, None) for b in user_requests)
+        seeds.update(dict.fromkeys(seed_asins))
+    # only the most recent requests are used as seeds to limit the amount of sims requests
+    seeds.update(dict.fromkeys(b.asin for b in islice(user_requests, _max_seeds)))
+    # seeds and anything the user already requested are never recommended
+    excluded_asins = frozenset(seeds).union(b.asin for b in user_requests)
 
     if not seeds:
         logger.debug(
@@ -88,7 +124,8 @@ async def get_user_sims_recommendations(
 
     async def _fetch(asin: str) -> list[_RankedRecommendation]:
         try:
-            books = await list_similar_audible_books(session, client_session, asin)
+            async with _sims_fetch_semaphore:
+                books = await list_similar_audible_books(session, client_session, asin)
             return [
                 _RankedRecommendation(book=b, rank=idx) for idx, b in enumerate(books)
             ]
@@ -100,7 +137,7 @@ async def get_user_sims_recommendations(
     # flatten and extract input (seed) and requested asins
     # NOTE: this also filters out any books that have already been requested by the user
     similar_books = list(
-        s for s in chain.from_iterable(books) if s.book.asin not in seeds
+        s for s in chain.from_iterable(books) if s.book.asin not in excluded_asins
     )
 
     if not similar_books:
@@ -124,92 +161,90 @@ async def get_user_sims_recommendations(
     W_NARR_PREF = 0.6  # match with user's preferred narrators
     W_RECENT = 0.5  # slight novelty for newer releases
 
-    def _rank_component(avg_idx: float) -> float:
-        # Convert average index to a 0..1 score (higher is better)
-        return 1.0 / (1.0 + avg_idx)
-
-    def _pref_component(names: list[str], pref_counter: Counter[str]) -> float:
-        if not names:
-            return 0.0
-        return sum(pref_counter.get(n, 0) for n in names) / max(1.0, len(names))
+    # bound once, since they're looked up for every author/narrator of every candidate
+    author_get = user_authors.get
+    narrator_get = user_narrators.get
 
-    def _recent_component(b: Audiobook) -> float:
-        try:
-            age_days = max(0.0, (datetime.now() - b.release_date).days)
-            # Newer books get up to ~1.0 bonus, decaying over ~2 years
-            return max(0.0, 1.0 - (age_days / 730.0))
-        except Exception:
-            return 0.0
-
-    # Build candidate score list
-    candidate_scores: list[_BookScore] = []
-    for sim in similar_books:
-        if sim.book.downloaded:
-            continue
+    now = datetime.now()
 
-        avg_pos = sum(positions[sim.book.asin]) / max(1, len(positions[sim.book.asin]))
-        count = frequency[sim.book.asin]
-
-        score = (
-            W_FREQ * float(count)
-            + W_RANK * _rank_component(avg_pos)
-            + W_AUTHOR_PREF * _pref_component(sim.book.authors, user_authors)
-            + W_NARR_PREF * _pref_component(sim.book.narrators, user_narrators)
-            + W_RECENT * _recent_component(sim.book)
-        )
-
-        # Build human-readable reason
+    # Reasons are only built for the books ending up on the requested page
+    def _build_reason(sim: _BookScore) -> str:
         reason_parts: list[str] = []
-        if count > 0:
-            reason_parts.append(f"similar to {count} of your books")
-        if avg_pos < 3:
+        if sim.count > 0:
+            reason_parts.append(f"similar to {sim.count} of your books")
+        if sim.avg_rank < 3:
             reason_parts.append("highly ranked in Audible sims")
-        elif avg_pos < 8:
+        elif sim.avg_rank < 8:
             reason_parts.append("recommended by Audible sims")
         # Author/Narrator matches
-        matched_authors = [
-            a for a in (sim.book.authors or []) if user_authors.get(a, 0) > 0
-        ]
+        matched_authors = [a for a in (sim.book.authors or []) if a in user_authors]
         if matched_authors:
             # show up to 2
             reason_parts.append(
                 "by your frequent author " + ", ".join(matched_authors[:2])
             )
-        matched_narrs = [
-            n for n in (sim.book.narrators or []) if user_narrators.get(n, 0) > 0
-        ]
-        if matched_narrs and not matched_authors:
+        matched_narr = any(n in user_narrators for n in (sim.book.narrators or []))
+        if matched_narr and not matched_authors:
             reason_parts.append("narrated by a favorite narrator")
-        if _recent_component(sim.book) > 0.6:
+        if sim.recent > 0.6:
             reason_parts.append("recent release")
 
-        reason = (
+        return (
             "; ".join(reason_parts)
             if reason_parts
             else "because you requested similar books"
         )
+
+    avg_positions = {asin: sum(p) / len(p) for asin, p in positions.items()}
+
+    # Build candidate score list. A book appearing in multiple sims lists gets the
+    # same score every time, so each book is only scored once.
+    candidate_scores: list[_BookScore] = []
+    scored_asins = set[str]()
+    for sim in similar_books:
+        asin = sim.book.asin
+        if sim.book.downloaded or asin in scored_asins:
+            continue
+        scored_asins.add(asin)
+
+        avg_pos = avg_positions[asin]
+        count = frequency[asin]
+        recent = _recent_component(sim.book, now)
+
+        score = (
+            W_FREQ * float(count)
+            + W_RANK * _rank_component(avg_pos)
+            + W_AUTHOR_PREF * _pref_component(sim.book.authors, author_get)
+            + W_NARR_PREF * _pref_component(sim.book.narrators, narrator_get)
+            + W_RECENT * recent
+        )
+
         candidate_scores.append(
             _BookScore(
                 book=sim.book,
                 score=score,
                 count=count,
                 avg_rank=avg_pos,
-                reason=reason,
+                recent=recent,
             )
         )
 
-    candidate_scores.sort(key=lambda x: (-x.score, x.avg_rank, -x.count))
+    total = len(candidate_scores)
+
+    # Only the top of the list ends up on the requested page. Some slack is kept so
+    # the author diversity pass below still has enough candidates to pick from.
+    candidate_scores = heapq.nlargest(
+        offset + limit * 4,
+        candidate_scores,
+        key=lambda x: (x.score, -x.avg_rank, x.count),
+    )
 
     # Diversity: limit over-repetition of same author in the top results (MMR-lite)
     MAX_PER_AUTHOR = 2
     author_counts = Counter[str]()
     diversified: list[_BookScore] = []
     remainder: list[_BookScore] = []
-    added_asins = set[str]()
     for sim in candidate_scores:
-        if sim.book.asin in added_asins:
-            continue
-        added_asins.add(sim.book.asin)
         authors = sim.book.authors or [""]
         # If any author exceeds cap, push to remainder; else accept
         if any(author_counts[a] >= MAX_PER_AUTHOR for a in authors if a):
@@ -233,8 +268,8 @@ async def get_user_sims_recommendations(
         results.append(
             AudiobookRecommendation(
                 book=book_with_requests,
-                reason=sim.reason,
+                reason=_build_reason(sim),
             )
         )
 
-    return UserSimsRecommendation(recommendations=results, total=len(ordered_books))
+    return UserSimsRecommendation(recommendations=results, total=total)
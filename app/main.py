@@ -1,14 +1,17 @@
+import asyncio
 import json
-from typing import Awaitable, Callable, cast
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, cast, final
 from urllib.parse import quote_plus, urlencode
 
 from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.middleware import Middleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import StreamingResponse
-from sqlalchemy import func
+from sqlalchemy import exists
 from sqlmodel import select
 from starlette.responses import Content
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.internal.audible.search import clear_old_book_caches
 from app.internal.auth.authentication import RequiresLoginException
@@ -22,7 +25,9 @@ from app.internal.env_settings import Settings
 from app.internal.models import User
 from app.internal.prowlarr.util import ProwlarrMisconfigured
 from app.routers import api, pages
-from app.util.db import get_session
+from app.routers.pages.static import precompute_static_files
+from app.util.connection import close_shared_session
+from app.util.db import session_scope
 from app.util.fetch_js import fetch_scripts
 from app.util.log import logger
 from app.util.redirect import BaseUrlRedirectResponse
@@ -32,10 +37,64 @@ from app.util.toast import ToastException
 # intialize js dependencies or throw an error if not in debug mode
 fetch_scripts(Settings().app.debug)
 
-with next(get_session()) as session:
+base_url = Settings().app.base_url.rstrip("/")
+
+with session_scope() as session:
     auth_secret = auth_config.get_auth_secret(session)
     initialize_force_login_type(session)
     clear_old_book_caches(session)
+    # on any but the very first start a user exists and the middleware never queries
+    user_exists = session.exec(select(exists().select_from(User))).one()
+
+_user_exists_lock = asyncio.Lock()
+
+
+@final
+class InitRedirectMiddleware:
+    """
+    Initial redirect if no user exists. We force the user to create a new login
+
+    Plain ASGI middleware, since it runs on every single request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        global user_exists
+        path = cast(str, scope["path"]).removeprefix(base_url)
+        # once a user exists, this stays true for the rest of the process' lifetime
+        if user_exists:
+            if path.startswith("/init"):
+                return await BaseUrlRedirectResponse("/")(scope, receive, send)
+            return await self.app(scope, receive, send)
+
+        if (
+            path != "/init"
+            and not path.startswith("/static")
+            and scope["method"] == "GET"
+        ):
+            # only a single request checks the database while no user is known to exist
+            async with _user_exists_lock:
+                if not user_exists:
+                    with session_scope() as session:
+                        user_exists = session.exec(
+                            select(exists().select_from(User))
+                        ).one()
+            if not user_exists:
+                return await BaseUrlRedirectResponse("/init")(scope, receive, send)
+        await self.app(scope, receive, send)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    _ = app
+    precompute_static_files()
+    yield
+    await close_shared_session()
 
 
 app = FastAPI(
@@ -44,18 +103,18 @@ app = FastAPI(
     openapi_url="/openapi.json" if Settings().app.openapi_enabled else None,
     description="API for AudiobookRequest",
     middleware=[
+        Middleware(InitRedirectMiddleware),
         Middleware(DynamicSessionMiddleware, auth_secret, middleware_linker),
         Middleware(GZipMiddleware),
     ],
-    root_path=Settings().app.base_url.rstrip("/"),
+    root_path=base_url,
     redirect_slashes=False,
+    lifespan=lifespan,
 )
 
 app.include_router(pages.router, include_in_schema=False)
 app.include_router(api.router)
 
-user_exists = False
-
 
 @app.exception_handler(RequiresLoginException)
 async def redirect_to_login(request: Request, exc: RequiresLoginException):
@@ -63,7 +122,8 @@ async def redirect_to_login(request: Request, exc: RequiresLoginException):
         params: dict[str, str] = {}
         if exc.detail:
             params["error"] = exc.detail
-        path = request.url.path.removeprefix(Settings().app.base_url.rstrip("/"))
+        # read from the scope directly, since request.url parses the whole URL
+        path = cast(str, request.scope["path"]).removeprefix(base_url)
         if path != "/" and not path.startswith("/login"):
             params["redirect_uri"] = path
         return BaseUrlRedirectResponse("/login?" + urlencode(params))
@@ -116,34 +176,6 @@ async def raise_toast(request: Request, exc: ToastException):
     )
 
 
-@app.middleware("http")
-async def redirect_to_init(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[StreamingResponse]],
-):
-    """
-    Initial redirect if no user exists. We force the user to create a new login
-    """
-    global user_exists
-    path = request.url.path.removeprefix(Settings().app.base_url.rstrip("/"))
-    if (
-        not user_exists
-        and path != "/init"
-        and not path.startswith("/static")
-        and request.method == "GET"
-    ):
-        with next(get_session()) as session:
-            user_count = session.exec(select(func.count()).select_from(User)).one()
-            if user_count == 0:
-                return BaseUrlRedirectResponse("/init")
-            else:
-                user_exists = True
-    elif user_exists and path.startswith("/init"):
-        return BaseUrlRedirectResponse("/")
-    response = await call_next(request)
-    return response
-
-
 @app.middleware("http")
 async def throw_toast_exception(
     request: Request,
@@ -156,16 +188,10 @@ async def throw_toast_exception(
         and not response.headers.get("HX-Redirect")  # already handled
         and request.headers.get("HX-Request") == "true"
     ):
-
-        def to_string(b: Content) -> str:
-            if isinstance(b, bytes):
-                return b.decode("utf-8")
-            elif isinstance(b, str):
-                return b
-            else:
-                return str(b)
-
-        body = "".join([to_string(x) async for x in response.body_iterator])
+        chunks: list[Content] = [x async for x in response.body_iterator]
+        body = b"".join(x.encode() if isinstance(x, str) else x for x in chunks).decode(
+            "utf-8", "replace"
+        )
 
         logger.error(
             "Error response",
@@ -174,13 +200,14 @@ async def throw_toast_exception(
             method=request.method,
             detail=body,
         )
-        try:
-            parsed = json.loads(body)  # pyright: ignore[reportAny]
-            if "detail" not in parsed or not isinstance(parsed["detail"], str):
-                raise ValueError()
-            error_message = cast(str, parsed["detail"])
-        except json.JSONDecodeError, ValueError:
-            error_message = f"An error occurred while processing your request. status={response.status_code}"
+        error_message = f"An error occurred while processing your request. status={response.status_code}"
+        if response.headers.get("content-type", "").startswith("application/json"):
+            try:
+                parsed = json.loads(body)  # pyright: ignore[reportAny]
+                if "detail" in parsed and isinstance(parsed["detail"], str):
+                    error_message = cast(str, parsed["detail"])
+            except json.JSONDecodeError:
+                pass
 
         return await raise_toast(request, ToastException(error_message, type="error"))
     return response
@@ -21,7 +21,12 @@ from app.internal.audible.types import (
 )
 from app.internal.audiobookshelf.client import background_abs_trigger_scan
 from app.internal.audiobookshelf.config import abs_config
-from app.internal.auth.authentication import AnyAuth, DetailedUser
+from app.internal.auth.authentication import (
+    DetailedUser,
+    any_auth,
+    any_auth_admin,
+    any_auth_trusted,
+)
 from app.internal.db_queries import get_wishlist_results
 from app.internal.models import (
     Audiobook,
@@ -58,7 +63,7 @@ class DownloadSourceBody(BaseModel):
 async def create_request(
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    user: Annotated[DetailedUser, Security(AnyAuth())],
+    user: Annotated[DetailedUser, Security(any_auth)],
     background_task: BackgroundTasks,
     asin_or_uuid: str,
     region: audible_region_type | None = None,
@@ -129,7 +134,7 @@ async def create_request(
 @router.get("", response_model=list[AudiobookWishlistResult])
 async def list_requests(
     session: Annotated[Session, Depends(get_session)],
-    user: Annotated[DetailedUser, Security(AnyAuth())],
+    user: Annotated[DetailedUser, Security(any_auth)],
     filter: Literal["all", "downloaded", "not_downloaded"] = "all",
 ):
     username = None if user.is_admin() else user.username
@@ -141,7 +146,7 @@ async def list_requests(
 async def delete_request(
     asin_or_uuid: str,
     session: Annotated[Session, Depends(get_session)],
-    user: Annotated[DetailedUser, Security(AnyAuth())],
+    user: Annotated[DetailedUser, Security(any_auth)],
 ):
     if user.is_admin():
         session.execute(
@@ -163,9 +168,9 @@ async def mark_downloaded(
     asin_or_uuid: str,
     session: Annotated[Session, Depends(get_session)],
     background_task: BackgroundTasks,
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
-    book = session.exec(select(Audiobook).where(Audiobook.asin == asin_or_uuid)).first()
+    book = session.get(Audiobook, asin_or_uuid)
     if book:
         book.downloaded = True
         session.add(book)
@@ -183,7 +188,7 @@ async def mark_downloaded(
 @router.get("/manual", response_model=list[ManualBookRequest])
 async def list_manual_requests(
     session: Annotated[Session, Depends(get_session)],
-    user: Annotated[DetailedUser, Security(AnyAuth())],
+    user: Annotated[DetailedUser, Security(any_auth)],
 ):
     return session.exec(
         select(ManualBookRequest)
@@ -209,7 +214,7 @@ async def create_manual_request(
     body: ManualRequest,
     session: Annotated[Session, Depends(get_session)],
     background_task: BackgroundTasks,
-    user: Annotated[DetailedUser, Security(AnyAuth())],
+    user: Annotated[DetailedUser, Security(any_auth)],
 ):
     book_request = ManualBookRequest(
         user_username=user.username,
@@ -236,7 +241,7 @@ async def update_manual_request(
     id: uuid.UUID,
     body: ManualRequest,
     session: Annotated[Session, Depends(get_session)],
-    user: Annotated[DetailedUser, Security(AnyAuth())],
+    user: Annotated[DetailedUser, Security(any_auth)],
 ):
     book_request = session.get(ManualBookRequest, id)
     if not book_request:
@@ -262,7 +267,7 @@ async def mark_manual_downloaded(
     id: uuid.UUID,
     session: Annotated[Session, Depends(get_session)],
     background_task: BackgroundTasks,
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     book_request = session.get(ManualBookRequest, id)
     if book_request:
@@ -283,7 +288,7 @@ async def mark_manual_downloaded(
 async def delete_manual_request(
     id: uuid.UUID,
     session: Annotated[Session, Depends(get_session)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     book = session.get(ManualBookRequest, id)
     if book:
@@ -301,7 +306,7 @@ async def refresh_source(
     asin_or_uuid: str,
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    user: Annotated[DetailedUser, Security(AnyAuth())],
+    user: Annotated[DetailedUser, Security(any_auth)],
     force_refresh: bool = False,
 ):
     _ = user
@@ -320,7 +325,7 @@ async def list_sources(
     asin_or_uuid: str,
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    admin_user: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(any_auth_admin)],
     only_cached: bool = False,
 ):
     _ = admin_user
@@ -345,7 +350,7 @@ async def download_book(
     body: DownloadSourceBody,
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    admin_user: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     _ = admin_user
     try:
@@ -372,7 +377,7 @@ async def start_auto_download_endpoint(
     asin_or_uuid: str,
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    trusted_user: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.trusted))],
+    trusted_user: Annotated[DetailedUser, Security(any_auth_trusted)],
 ):
     _ = trusted_user
     try:
@@ -10,9 +10,9 @@ from app.internal.audible.types import (
     audible_regions,
     get_region_from_settings,
 )
-from app.internal.auth.authentication import AnyAuth, DetailedUser
+from app.internal.auth.authentication import DetailedUser, any_auth
 from app.internal.models import Audiobook, AudiobookWithRequests
-from app.util.connection import get_connection
+from app.util.connection import get_connection, get_shared_session
 from app.util.db import get_session
 
 router = APIRouter(prefix="/search", tags=["Search"])
@@ -22,7 +22,7 @@ router = APIRouter(prefix="/search", tags=["Search"])
 async def search_books(
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    user: Annotated[DetailedUser, Security(AnyAuth())],
+    user: Annotated[DetailedUser, Security(any_auth)],
     query: Annotated[str | None, Query(alias="q")] = None,
     num_results: int = 20,
     page: int = 0,
@@ -61,10 +61,9 @@ async def search_books(
 @router.get("/suggestions", response_model=list[str])
 async def search_suggestions(
     query: Annotated[str, Query(alias="q")],
-    _: Annotated[DetailedUser, Security(AnyAuth())],
+    _: Annotated[DetailedUser, Security(any_auth)],
     region: audible_region_type | None = None,
 ):
     if region is None:
         region = get_region_from_settings()
-    async with ClientSession() as client_session:
-        return await get_search_suggestions(client_session, query, region)
+    return await get_search_suggestions(get_shared_session(), query, region)
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Annotated
 
 from aiohttp import ClientSession
@@ -12,8 +13,7 @@ from app.internal.audiobookshelf.client import (
 )
 from app.internal.audiobookshelf.config import abs_config
 from app.internal.audiobookshelf.types import ABSLibrary
-from app.internal.auth.authentication import AnyAuth, DetailedUser
-from app.internal.models import GroupEnum
+from app.internal.auth.authentication import DetailedUser, any_auth_admin
 from app.util.connection import get_connection
 from app.util.db import get_session
 from app.util.log import logger
@@ -33,7 +33,7 @@ class ABSResponse(BaseModel):
 async def read_abs(
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    admin_user: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     _ = admin_user
     base_url = abs_config.get_base_url(session) or ""
@@ -57,7 +57,7 @@ async def read_abs(
 def update_abs_base_url(
     base_url: Annotated[str, Form()],
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     _ = admin_user
     abs_config.set_base_url(session, base_url)
@@ -68,7 +68,7 @@ def update_abs_base_url(
 def update_abs_api_token(
     api_token: Annotated[str, Form(alias="api_token")],
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     _ = admin_user
     abs_config.set_api_token(session, api_token)
@@ -79,7 +79,7 @@ def update_abs_api_token(
 def update_abs_library(
     library_id: Annotated[str, Form(alias="library_id")],
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     _ = admin_user
     abs_config.set_library_id(session, library_id)
@@ -89,7 +89,7 @@ def update_abs_library(
 @router.put("/check-downloaded")
 def update_abs_check_downloaded(
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(any_auth_admin)],
     check_downloaded: Annotated[bool, Form()] = False,
 ):
     _ = admin_user
@@ -107,7 +107,7 @@ class TestResponse(BaseModel):
 async def test_abs_connection(
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     abs_config.raise_if_invalid(session)
     libraries = await abs_get_libraries(session, client_session)
@@ -118,13 +118,23 @@ async def test_abs_connection(
     logger.info(
         "Successfully connected to Audiobookshelf", library_count=len(libraries)
     )
-    success = await abs_trigger_scan(session, client_session)
+    # the scan trigger and the item listing are independent, so run them concurrently.
+    # The item listing is also sent if the scan fails, but only the scan's error is
+    # returned in that case.
+    success, list_library_items = await asyncio.gather(
+        abs_trigger_scan(session, client_session),
+        abs_list_library_items(session, client_session),
+        return_exceptions=True,
+    )
+    if isinstance(success, BaseException):
+        raise success
     if not success:
         raise HTTPException(
             status_code=400, detail="Failed to trigger scan on Audiobookshelf"
         )
     logger.info("Successfully triggered scan on Audiobookshelf")
-    list_library_items = await abs_list_library_items(session, client_session)
+    if isinstance(list_library_items, BaseException):
+        raise list_library_items
     logger.info(
         "Fetched items from Audiobookshelf library",
         item_count=len(list_library_items),
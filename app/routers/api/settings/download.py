@@ -4,8 +4,7 @@ from fastapi import APIRouter, Depends, Response, Security
 from pydantic import BaseModel
 from sqlmodel import Session
 
-from app.internal.auth.authentication import AnyAuth, DetailedUser
-from app.internal.models import GroupEnum
+from app.internal.auth.authentication import DetailedUser, any_auth_admin
 from app.internal.ranking.quality import IndexerFlag, QualityRange, quality_config
 from app.util.db import get_session
 
@@ -28,7 +27,7 @@ class DownloadSettings(BaseModel):
 @router.get("", response_model=DownloadSettings)
 def get_download_settings(
     session: Annotated[Session, Depends(get_session)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     return DownloadSettings(
         auto_download=quality_config.get_auto_download(session),
@@ -60,7 +59,7 @@ class UpdateDownloadSettings(BaseModel):
 def update_download_settings(
     body: UpdateDownloadSettings,
     session: Annotated[Session, Depends(get_session)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     quality_config.set_auto_download(session, body.auto_download)
     quality_config.set_range(session, "quality_flac", body.flac_range)
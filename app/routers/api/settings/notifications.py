@@ -6,10 +6,9 @@ from fastapi import APIRouter, Depends, HTTPException, Response, Security
 from pydantic import BaseModel, Field
 from sqlmodel import Session, select
 
-from app.internal.auth.authentication import AnyAuth, DetailedUser
+from app.internal.auth.authentication import DetailedUser, any_auth_admin
 from app.internal.models import (
     EventEnum,
-    GroupEnum,
     Notification,
     NotificationBodyTypeEnum,
 )
@@ -32,7 +31,7 @@ class NotificationRequest(BaseModel):
 @router.get("", response_model=list[Notification])
 def list_notifications(
     session: Annotated[Session, Depends(get_session)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     return session.exec(select(Notification)).all()
 
@@ -113,7 +112,7 @@ def _upsert_notification(
 def create_notification(
     body: NotificationRequest,
     session: Annotated[Session, Depends(get_session)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     return _upsert_notification(
         notification_id=body.id,
@@ -131,7 +130,7 @@ def create_notification(
 def delete_notification(
     id: uuid.UUID,
     session: Annotated[Session, Depends(get_session)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     notif = session.get(Notification, id)
     if not notif:
@@ -146,7 +145,7 @@ def delete_notification(
 async def test_notification_id(
     id: uuid.UUID,
     session: Annotated[Session, Depends(get_session)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     notif = session.get(Notification, id)
     if not notif:
@@ -164,7 +163,7 @@ async def test_notification_id(
 def toggle_notification(
     id: uuid.UUID,
     session: Annotated[Session, Depends(get_session)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     notif = session.get(Notification, id)
     if not notif:
@@ -181,7 +180,7 @@ def toggle_notification(
 async def test_notification(
     body: NotificationRequest,
     session: Annotated[Session, Depends(get_session)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     headers_json = _validate_headers(body.headers)
     try:
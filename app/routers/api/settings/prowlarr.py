@@ -5,8 +5,7 @@ from fastapi import APIRouter, Depends, Response, Security
 from pydantic import BaseModel
 from sqlmodel import Session
 
-from app.internal.auth.authentication import AnyAuth, DetailedUser
-from app.internal.models import GroupEnum
+from app.internal.auth.authentication import DetailedUser, any_auth_admin
 from app.internal.prowlarr.indexer_categories import indexer_categories
 from app.internal.prowlarr.prowlarr import IndexerResponse, get_indexers
 from app.internal.prowlarr.util import flush_prowlarr_cache, prowlarr_config
@@ -29,7 +28,7 @@ class ProwlarrSettings(BaseModel):
 async def get_prowlarr_settings(
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     indexers = await get_indexers(session, client_session)
     return ProwlarrSettings(
@@ -50,7 +49,7 @@ class UpdateApiKey(BaseModel):
 def update_prowlarr_api_key(
     body: UpdateApiKey,
     session: Annotated[Session, Depends(get_session)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     prowlarr_config.set_api_key(session, body.api_key)
     flush_prowlarr_cache()
@@ -65,7 +64,7 @@ class UpdateBaseUrl(BaseModel):
 def update_prowlarr_base_url(
     body: UpdateBaseUrl,
     session: Annotated[Session, Depends(get_session)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     prowlarr_config.set_base_url(session, body.base_url)
     flush_prowlarr_cache()
@@ -80,7 +79,7 @@ class UpdateCategories(BaseModel):
 def update_indexer_categories(
     body: UpdateCategories,
     session: Annotated[Session, Depends(get_session)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     prowlarr_config.set_categories(session, body.categories)
     flush_prowlarr_cache()
@@ -1,17 +1,20 @@
 from typing import Annotated, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Security, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from sqlmodel import Session, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, col, func, select
 
 from app.internal.auth.authentication import (
-    AnyAuth,
     DetailedUser,
+    any_auth,
+    any_auth_admin,
     create_user,
     raise_for_invalid_password,
 )
 from app.internal.models import GroupEnum, User
-from app.util.db import get_session
+from app.util.db import get_session, session_scope
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -50,36 +53,85 @@ class UserUpdate(BaseModel):
 
 class UsersListResponse(BaseModel):
     users: List[UserResponse] = Field(description="List of users")
-    total: int = Field(description="Total number of users")
+    total: int | None = Field(
+        description="Total number of users. Only set if `include_total` is true"
+    )
+    next_cursor: str | None = Field(
+        None,
+        description="Pass as `after` to get the next page. Not set on the last page",
+    )
 
 
 @router.get("/", response_model=UsersListResponse)
 def list_users(
     session: Annotated[Session, Depends(get_session)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
     limit: Annotated[
         int, Query(ge=1, le=100, description="Maximum number of users to return")
     ] = 50,
     offset: Annotated[int, Query(ge=0, description="Number of users to skip")] = 0,
+    after: Annotated[
+        str | None,
+        Query(description="Only return users after this username (keyset pagination)"),
+    ] = None,
+    include_total: Annotated[
+        bool, Query(description="Whether to count the total number of users")
+    ] = True,
 ):
     """
-    Returns a paginated list of all users with their basic information.
+    Returns a paginated list of all users with their basic information, ordered by
+    username. Paging with `after` instead of `offset` doesn't have to skip over all
+    previous users.
 
     **Requires:** Admin privileges
     """
-    query = select(User).offset(offset).limit(limit)
+    query = select(User).order_by(col(User.username)).limit(limit)
+    if after is not None:
+        query = query.where(col(User.username) > after)
+    if offset:
+        query = query.offset(offset)
     users = session.exec(query).all()
-    total = session.exec(select(func.count()).select_from(User)).one()
+
+    total = None
+    if include_total:
+        total = session.exec(select(func.count(col(User.username)))).one()
 
     return UsersListResponse(
         users=[UserResponse.from_user(user) for user in users],
         total=total,
+        next_cursor=users[-1].username if len(users) == limit else None,
     )
 
 
+# ".ndjson" resolves to "/users.ndjson", so it can't collide with a username
+@router.get(".ndjson", response_class=StreamingResponse)
+def export_users(
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
+):
+    """
+    Streams all users as newline-delimited JSON (one user object per line), ordered by
+    username. Users are loaded in batches, so memory usage stays the same no matter
+    how many users there are.
+
+    **Requires:** Admin privileges
+    """
+
+    def generate():
+        with session_scope() as session:
+            users = session.exec(
+                select(User)
+                .order_by(col(User.username))
+                .execution_options(yield_per=200)
+            )
+            for user in users:
+                yield UserResponse.from_user(user).model_dump_json() + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/me", response_model=UserResponse)
 def get_current_user(
-    current_user: Annotated[DetailedUser, Security(AnyAuth())],
+    current_user: Annotated[DetailedUser, Security(any_auth)],
 ):
     """
     Returns information about the user associated with the provided API key.
@@ -93,7 +145,7 @@ def get_current_user(
 def get_user(
     username: str,
     session: Annotated[Session, Depends(get_session)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     """
     Returns detailed information about the specified user.
@@ -114,7 +166,7 @@ def get_user(
 def create_new_user(
     user_data: UserCreate,
     session: Annotated[Session, Depends(get_session)],
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     """
     Creates a new user with the specified username, password, and group.
@@ -145,15 +197,25 @@ def create_new_user(
         extra_data=user_data.extra_data,
     )
 
+    # built before committing, since the commit expires the user's attributes
+    response = UserResponse.from_user(user)
     session.add(user)
-    session.commit()
+    try:
+        session.commit()
+    except IntegrityError:
+        # the same username was created concurrently
+        session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Username already exists",
+        )
 
-    return UserResponse.from_user(user)
+    return response
 
 
 @router.put("/{username}", response_model=UserResponse)
 def update_user(
-    _: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    _: Annotated[DetailedUser, Security(any_auth_admin)],
     session: Annotated[Session, Depends(get_session)],
     username: str,
     user_data: UserUpdate,
@@ -203,17 +265,18 @@ def update_user(
     if user_data.group is not None:
         user.group = user_data.group
 
-    session.add(user)
+    # the user is already tracked by the session, so it only has to be committed
+    response = UserResponse.from_user(user)
     session.commit()
 
-    return UserResponse.from_user(user)
+    return response
 
 
 @router.delete("/{username}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_user(
     username: str,
     session: Annotated[Session, Depends(get_session)],
-    current_user: Annotated[DetailedUser, Security(AnyAuth(GroupEnum.admin))],
+    current_user: Annotated[DetailedUser, Security(any_auth_admin)],
 ):
     """
     Permanently removes the specified user from the system.
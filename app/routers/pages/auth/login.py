@@ -7,8 +7,8 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlmodel import Session
 
 from app.internal.auth.authentication import (
-    ABRAuth,
     RequiresLoginException,
+    abr_auth,
     authenticate_user,
 )
 from app.internal.auth.config import auth_config
@@ -37,7 +37,7 @@ async def login(
         backup = False
 
     try:
-        await ABRAuth()(request, session)
+        await abr_auth(request, session)
         # already logged in
         return BaseUrlRedirectResponse(redirect_uri)
     except HTTPException, RequiresLoginException:
@@ -10,10 +10,7 @@ from fastapi import (
 )
 from sqlmodel import Session
 
-from app.internal.auth.authentication import (
-    ABRAuth,
-    DetailedUser,
-)
+from app.internal.auth.authentication import DetailedUser, abr_auth
 from app.internal.auth.config import auth_config
 from app.internal.auth.login_types import LoginTypeEnum
 from app.internal.auth.oidc_config import oidc_config
@@ -26,7 +23,7 @@ router = APIRouter(prefix="/logout")
 async def logout(
     request: Request,
     session: Annotated[Session, Depends(get_session)],
-    _: Annotated[DetailedUser, Security(ABRAuth())],
+    _: Annotated[DetailedUser, Security(abr_auth)],
 ):
     request.session["sub"] = ""
 
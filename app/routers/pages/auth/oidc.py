@@ -13,7 +13,7 @@ from fastapi import (
     status,
 )
 from pydantic import BaseModel
-from sqlmodel import Session, select
+from sqlmodel import Session
 
 from app.internal.auth.authentication import (
     create_user,
@@ -131,7 +131,7 @@ async def login_oidc(
     else:
         groups = []
 
-    user = session.exec(select(User).where(User.username == username)).first()
+    user = session.get(User, username)
     if not user:
         user = create_user(
             username=username,
@@ -3,11 +3,11 @@ from typing import Annotated
 from aiohttp import ClientSession
 from fastapi import APIRouter, Depends, Query, Security
 from pydantic import BaseModel
-from sqlalchemy.sql.functions import count
+from sqlalchemy import exists
 from sqlmodel import Session, select
 
 from app.internal.audible.types import audible_region_type, get_region_tld_from_settings
-from app.internal.auth.authentication import ABRAuth, DetailedUser
+from app.internal.auth.authentication import DetailedUser, abr_auth
 from app.internal.models import AudiobookRequest, AudiobookWithRequests
 from app.internal.ranking.quality import quality_config
 from app.routers.api.recommendations import (
@@ -40,16 +40,13 @@ router = APIRouter()
 
 @router.get("/")
 def read_root(
-    user: Annotated[DetailedUser, Security(ABRAuth())],
+    user: Annotated[DetailedUser, Security(abr_auth)],
     session: Annotated[Session, Depends(get_session)],
 ):
     # no need to show the popular tab if there are no requests from other users
-    show_popular = (
-        0
-        < session.exec(
-            select(count("*")).where(AudiobookRequest.user_username != user.username)
-        ).one()
-    )
+    show_popular = session.exec(
+        select(exists().where(AudiobookRequest.user_username != user.username))
+    ).one()
     return catalog_response(
         "Index.Index",
         user=user,
@@ -63,7 +60,7 @@ def read_root(
 async def get_user_recommendations(
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    user: Annotated[DetailedUser, Security(ABRAuth())],
+    user: Annotated[DetailedUser, Security(abr_auth)],
     seed_asins: Annotated[list[str] | None, Query(alias="seed_asins")] = None,
     limit: int = 20,
 ):
@@ -91,7 +88,7 @@ async def get_user_recommendations(
 @router.get("/hx-popular")
 async def get_popular_recommendations(
     session: Annotated[Session, Depends(get_session)],
-    user: Annotated[DetailedUser, Security(ABRAuth())],
+    user: Annotated[DetailedUser, Security(abr_auth)],
     min_requests: int = 1,
     limit: int = 10,
     exclude_downloaded: bool = True,
@@ -120,7 +117,7 @@ async def get_popular_recommendations(
 async def get_category_recommendations(
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    user: Annotated[DetailedUser, Security(ABRAuth())],
+    user: Annotated[DetailedUser, Security(abr_auth)],
     audible_region: audible_region_type | None = None,
 ):
     result = await api_get_category_recommendations(
@@ -155,7 +152,7 @@ class _AudiobookReasonWrapper(BaseModel):
 @router.get("/hx-recent")
 async def get_recently_requested_recommendations(
     session: Annotated[Session, Depends(get_session)],
-    user: Annotated[DetailedUser, Security(ABRAuth())],
+    user: Annotated[DetailedUser, Security(abr_auth)],
     limit: int = 10,
     days_back: int = 30,
     exclude_downloaded: bool = True,
@@ -188,7 +185,7 @@ async def get_recently_requested_recommendations(
 async def get_fallback_recommendations(
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    user: Annotated[DetailedUser, Security(ABRAuth())],
+    user: Annotated[DetailedUser, Security(abr_auth)],
     limit: int = 10,
     audible_region: audible_region_type | None = None,
 ):
@@ -222,7 +219,7 @@ async def get_fallback_recommendations(
 async def get_popular_authors_recommendations(
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    user: Annotated[DetailedUser, Security(ABRAuth())],
+    user: Annotated[DetailedUser, Security(abr_auth)],
     limit: int = 10,
     exclude_downloaded: bool = True,
     audible_region: audible_region_type | None = None,
@@ -257,7 +254,7 @@ async def get_popular_authors_recommendations(
 async def get_popular_narrators_recommendations(
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    user: Annotated[DetailedUser, Security(ABRAuth())],
+    user: Annotated[DetailedUser, Security(abr_auth)],
     limit: int = 10,
     exclude_downloaded: bool = True,
     audible_region: audible_region_type | None = None,
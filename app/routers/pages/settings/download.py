@@ -3,8 +3,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Form, Response, Security
 from sqlmodel import Session
 
-from app.internal.auth.authentication import ABRAuth, DetailedUser
-from app.internal.models import GroupEnum
+from app.internal.auth.authentication import DetailedUser, abr_auth_admin
 from app.internal.ranking.quality import IndexerFlag, QualityRange, quality_config
 from app.routers.api.settings.download import (
     UpdateDownloadSettings,
@@ -21,7 +20,7 @@ router = APIRouter(prefix="/download")
 @router.get("")
 def read_download(
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(abr_auth_admin)],
 ):
     auto_download = quality_config.get_auto_download(session)
     flac_range = quality_config.get_range(session, "quality_flac")
@@ -66,7 +65,7 @@ def update_download(
     name_ratio: Annotated[int, Form()],
     title_ratio: Annotated[int, Form()],
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(abr_auth_admin)],
     auto_download: Annotated[bool, Form()] = False,
 ):
     flac = QualityRange(from_kbits=flac_from, to_kbits=flac_to)
@@ -112,7 +111,7 @@ def update_download(
 @router.delete("")
 def reset_download_setings(
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(abr_auth_admin)],
 ):
     _ = admin_user
     quality_config.reset_all(session)
@@ -124,7 +123,7 @@ def add_indexer_flag(
     session: Annotated[Session, Depends(get_session)],
     flag: Annotated[str, Form()],
     score: Annotated[int, Form()],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(abr_auth_admin)],
 ):
     _ = admin_user
     flags = quality_config.get_indexer_flags(session)
@@ -142,7 +141,7 @@ def add_indexer_flag(
 def remove_indexer_flag(
     flag: str,
     session: Annotated[Session, Depends(get_session)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(abr_auth_admin)],
 ):
     _ = admin_user
     flags = quality_config.get_indexer_flags(session)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 from contextlib import asynccontextmanager
@@ -8,17 +9,16 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import APIRouter, Depends, FastAPI, Form, Request, Security
 from sqlmodel import Session
 
-from app.internal.auth.authentication import ABRAuth, DetailedUser
+from app.internal.auth.authentication import DetailedUser, abr_auth_admin
 from app.internal.indexers.abstract import SessionContainer
 from app.internal.indexers.configuration import indexer_configuration_cache
 from app.internal.indexers.indexer_util import (
     get_indexer_contexts,
     update_single_indexer,
 )
-from app.internal.models import GroupEnum
 from app.util.cache import StringConfigCache
-from app.util.connection import get_connection
-from app.util.db import get_session
+from app.util.connection import get_connection, get_shared_session
+from app.util.db import get_session, session_scope
 from app.util.log import logger
 from app.util.templates import catalog_response
 from app.util.toast import ToastException
@@ -29,12 +29,11 @@ last_modified = 0
 
 
 async def check_indexer_file_changes():
-    with next(get_session()) as session:
-        async with ClientSession() as client_session:
-            try:
-                await read_indexer_file(session, client_session)
-            except Exception as e:
-                logger.error("Failed to read indexer configuration file", error=str(e))
+    with session_scope() as session:
+        try:
+            await read_indexer_file(session, get_shared_session())
+        except Exception as e:
+            logger.error("Failed to read indexer configuration file", error=str(e))
 
 
 @asynccontextmanager
@@ -50,6 +49,11 @@ async def lifespan(app: FastAPI):
 router = APIRouter(prefix="/indexers", lifespan=lifespan)
 
 
+def _read_json_file(file_path: str) -> object:
+    with open(file_path, "r") as f:
+        return cast(object, json.load(f))
+
+
 async def read_indexer_file(
     session: Session, client_session: ClientSession, *, file_path: str | None = None
 ):
@@ -58,13 +62,12 @@ async def read_indexer_file(
     if not file_path:
         return
     try:
-        with open(file_path, "r") as f:
-            values = cast(object, json.load(f))
-            global last_modified
-            if (lm := os.path.getmtime(file_path)) == last_modified:
-                return
-            else:
-                last_modified = lm
+        global last_modified
+        if (lm := os.path.getmtime(file_path)) == last_modified:
+            return
+        # parse off the event loop, this runs every few seconds in the background
+        values = await asyncio.to_thread(_read_json_file, file_path)
+        last_modified = lm
     except Exception as e:
         raise ValueError(f"Failed to read file: {e}")
 
@@ -104,7 +107,7 @@ async def read_indexer_file(
 async def read_indexers(
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(abr_auth_admin)],
 ):
     file_path = indexer_config.get(session, "indexers_configuration_file")
     if file_path:
@@ -134,7 +137,7 @@ async def read_file_configuration(
     file_path: Annotated[str, Form()],
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(abr_auth_admin)],
 ):
     _ = admin_user
     if file_path.strip() == "":
@@ -157,7 +160,7 @@ async def update_indexers(
     indexer_select: Annotated[str, Form()],
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(abr_auth_admin)],
 ):
     _ = admin_user
     values = dict(await request.form())
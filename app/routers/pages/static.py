@@ -1,9 +1,9 @@
 import hashlib
-from os import PathLike
+import mimetypes
+import os
 from pathlib import Path
-from typing import Callable
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
 
 from app.internal.env_settings import Settings
@@ -12,103 +12,85 @@ router = APIRouter(prefix="/static")
 
 
 root = Path("static")
+debug = Settings().app.debug
 
-etag_cache: dict[PathLike[str] | str, str] = {}
+# path -> (etag, stat result). The stat result is passed on to FileResponse, so it
+# doesn't have to stat the file in a worker thread on every request
+file_cache: dict[str, tuple[str, os.stat_result]] = {}
 
 
-def add_cache_headers(func: Callable[..., FileResponse]):
-    def wrapper(v: object):
-        _ = v
-        file = func()
-        etag = etag_cache.get(file.path)
-        if not etag or Settings().app.debug:
-            with open(file.path, "rb") as f:
-                etag = hashlib.sha1(f.read(), usedforsecurity=False).hexdigest()
-            etag_cache[file.path] = etag
+def _load_file(path: str | Path) -> tuple[str, os.stat_result]:
+    with open(path, "rb") as f:
+        etag = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        return etag, os.fstat(f.fileno())
 
-        file.headers.append("Etag", etag)
-        # cache for a year. All static files should do cache busting with `?v=<version>`
-        file.headers.append("Cache-Control", f"public, max-age={60 * 60 * 24 * 365}")
-        return file
 
-    return wrapper
+def precompute_static_files():
+    """Hashes all static files on startup, so no request has to read a whole file"""
+    for file in root.iterdir():
+        if file.is_file():
+            file_cache[str(file)] = _load_file(file)
 
 
-@router.get("/globals.css")
-@add_cache_headers
-def read_globals_css():
-    return FileResponse(root / "globals.css", media_type="text/css")
+# media types that differ between systems or are missing from `mimetypes`
+_media_type_overrides = {
+    ".js": "text/javascript",
+    ".webmanifest": "application/manifest+json",
+}
 
 
-@router.get("/nouislider.css")
-@add_cache_headers
-def read_nouislider_css():
-    return FileResponse(root / "nouislider.min.css", media_type="text/css")
-
-
-@router.get("/nouislider.js")
-@add_cache_headers
-def read_nouislider_js():
-    return FileResponse(root / "nouislider.min.js", media_type="text/javascript")
-
-
-@router.get("/apple-touch-icon.png")
-@add_cache_headers
-def read_apple_touch_icon():
-    return FileResponse(root / "apple-touch-icon.png", media_type="image/png")
-
-
-@router.get("/favicon-32x32.png")
-@add_cache_headers
-def read_favicon_32():
-    return FileResponse(root / "favicon-32x32.png", media_type="image/png")
-
+def _media_type(file_name: str) -> str:
+    return (
+        _media_type_overrides.get(Path(file_name).suffix)
+        or mimetypes.guess_type(file_name)[0]
+        or "application/octet-stream"
+    )
 
-@router.get("/favicon-16x16.png")
-@add_cache_headers
-def read_favicon_16():
-    return FileResponse(root / "favicon-16x16.png", media_type="image/png")
 
+# public file name -> (file in the static directory, media type)
+_static_files = {
+    name: (file_name, _media_type(file_name))
+    for name, file_name in {
+        "globals.css": "globals.css",
+        "nouislider.css": "nouislider.min.css",
+        "nouislider.js": "nouislider.min.js",
+        "apple-touch-icon.png": "apple-touch-icon.png",
+        "favicon-32x32.png": "favicon-32x32.png",
+        "favicon-16x16.png": "favicon-16x16.png",
+        "site.webmanifest": "site.webmanifest",
+        "htmx.js": "htmx.js",
+        "htmx-preload.js": "htmx-preload.js",
+        "alpine.js": "alpine.js",
+        "toastify.js": "toastify.js",
+        "toastify.css": "toastify.css",
+        "favicon.svg": "favicon.svg",
+    }.items()
+}
+# cache for a year. All static files should do cache busting with `?v=<version>`
+_cache_control = f"public, max-age={60 * 60 * 24 * 365}"
+
+
+@router.get("/{name}")
+def read_static_file(name: str):
+    entry = _static_files.get(name)
+    if not entry:
+        raise HTTPException(status_code=404, detail="File not found")
+    file_name, media_type = entry
+
+    path = str(root / file_name)
+    cached = file_cache.get(path)
+    # files can change while developing
+    if not cached or debug:
+        try:
+            cached = _load_file(path)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="File not found")
+        file_cache[path] = cached
+    etag, stat_result = cached
 
-@router.get("/site.webmanifest")
-@add_cache_headers
-def read_site_webmanifest():
     return FileResponse(
-        root / "site.webmanifest", media_type="application/manifest+json"
+        path,
+        media_type=media_type,
+        headers={"Etag": etag, "Cache-Control": _cache_control},
+        stat_result=stat_result,
     )
-
-
-@router.get("/htmx.js")
-@add_cache_headers
-def read_htmx():
-    return FileResponse(root / "htmx.js", media_type="text/javascript")
-
-
-@router.get("/htmx-preload.js")
-@add_cache_headers
-def read_htmx_preload():
-    return FileResponse(root / "htmx-preload.js", media_type="text/javascript")
-
-
-@router.get("/alpine.js")
-@add_cache_headers
-def read_alpinejs():
-    return FileResponse(root / "alpine.js", media_type="text/javascript")
-
-
-@router.get("/toastify.js")
-@add_cache_headers
-def read_toastifyjs():
-    return FileResponse(root / "toastify.js", media_type="text/javascript")
-
-
-@router.get("/toastify.css")
-@add_cache_headers
-def read_toastifycss():
-    return FileResponse(root / "toastify.css", media_type="text/css")
-
-
-@router.get("/favicon.svg")
-@add_cache_headers
-def read_favicon_svg():
-    return FileResponse(root / "favicon.svg", media_type="image/svg+xml")
@@ -4,9 +4,8 @@ from aiohttp import ClientSession
 from fastapi import APIRouter, Depends, Security
 from sqlmodel import Session
 
-from app.internal.auth.authentication import ABRAuth, DetailedUser
+from app.internal.auth.authentication import DetailedUser, abr_auth, abr_auth_trusted
 from app.internal.db_queries import get_wishlist_counts, get_wishlist_results
-from app.internal.models import GroupEnum
 from app.routers.api.requests import delete_request as api_delete_request
 from app.routers.api.requests import start_auto_download_endpoint
 from app.util.connection import get_connection
@@ -25,7 +24,7 @@ router.include_router(sources.router)
 @router.get("")
 async def wishlist(
     session: Annotated[Session, Depends(get_session)],
-    user: Annotated[DetailedUser, Security(ABRAuth())],
+    user: Annotated[DetailedUser, Security(abr_auth)],
 ):
     username = None if user.is_admin() else user.username
     results = get_wishlist_results(session, username, "not_downloaded")
@@ -43,7 +42,7 @@ async def start_auto_download(
     asin: str,
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.trusted))],
+    user: Annotated[DetailedUser, Security(abr_auth_trusted)],
 ):
     await start_auto_download_endpoint(asin, session, client_session, user)
     username = None if user.is_admin() else user.username
@@ -64,7 +63,7 @@ async def start_auto_download(
 async def delete_request(
     asin: str,
     session: Annotated[Session, Depends(get_session)],
-    user: Annotated[DetailedUser, Security(ABRAuth())],
+    user: Annotated[DetailedUser, Security(abr_auth)],
     downloaded: bool | None = None,
 ):
     await api_delete_request(asin, session, user)
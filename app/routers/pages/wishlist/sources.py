@@ -4,8 +4,7 @@ from aiohttp import ClientSession
 from fastapi import APIRouter, BackgroundTasks, Depends, Form, HTTPException, Security
 from sqlmodel import Session
 
-from app.internal.auth.authentication import ABRAuth, DetailedUser
-from app.internal.models import GroupEnum
+from app.internal.auth.authentication import DetailedUser, abr_auth_admin
 from app.routers.api.requests import DownloadSourceBody
 from app.routers.api.requests import download_book as api_download_book
 from app.routers.api.requests import list_sources as api_list_sources
@@ -22,7 +21,7 @@ async def list_sources(
     asin: str,
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(abr_auth_admin)],
     only_body: bool = False,
 ):
     try:
@@ -61,7 +60,7 @@ async def download_book(
     indexer_id: Annotated[int, Form()],
     session: Annotated[Session, Depends(get_session)],
     client_session: Annotated[ClientSession, Depends(get_connection)],
-    admin_user: Annotated[DetailedUser, Security(ABRAuth(GroupEnum.admin))],
+    admin_user: Annotated[DetailedUser, Security(abr_auth_admin)],
 ):
     body = DownloadSourceBody(guid=guid, indexer_id=indexer_id)
     return await api_download_book(
@@ -1,5 +1,7 @@
+import asyncio
+import threading
 import time
-from typing import overload
+from typing import Awaitable, Callable, overload
 
 from sqlmodel import Session, select
 
@@ -7,7 +9,9 @@ from app.internal.models import Config
 
 
 class SimpleCache[VT, *KTs]:
-    _cache: dict[tuple[*KTs], tuple[int, VT]] = {}
+    def __init__(self):
+        # per instance, so separate caches never see each other's entries
+        self._cache: dict[tuple[*KTs], tuple[int, VT]] = {}
 
     def get(self, source_ttl: int, *query: *KTs) -> VT | None:
         hit = self._cache.get(query)
@@ -34,8 +38,39 @@ class SimpleCache[VT, *KTs]:
         self._cache = {}
 
 
+class InFlight[VT, *KTs]:
+    """
+    Shares a running call between concurrent callers using the same key, so the
+    same request isn't sent multiple times while the first one is still running.
+    """
+
+    def __init__(self):
+        self._running: dict[tuple[*KTs], asyncio.Future[VT]] = {}
+
+    async def run(self, func: Callable[[], Awaitable[VT]], *key: *KTs) -> VT:
+        future = self._running.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._running[key] = future
+            future.add_done_callback(lambda _: self._running.pop(key, None))
+        # shielded so a cancelled caller doesn't cancel the call for everyone else
+        return await asyncio.shield(future)
+
+
+# How long config values are cached before being read from the database again.
+# Writes through set/delete are visible to everything in this process (including
+# background jobs) right away. Changes made by another process or directly in the
+# database can take up to this many seconds to show up. That includes keys that
+# were just configured or cleared, since unset keys are cached as well.
+_CONFIG_TTL = 10
+
+
 class StringConfigCache[L: str]:
-    _cache: dict[L, str] = {}
+    # None marks keys known to be unset, so they aren't looked up again either
+    _cache: dict[L, tuple[float, str | None]] = {}
+    _lock = threading.Lock()
+    # bumped on every write, so a read started before the write doesn't cache the old value
+    _generation = 0
 
     @overload
     def get(self, session: Session, key: L) -> str | None: ...
@@ -44,12 +79,26 @@ class StringConfigCache[L: str]:
     def get(self, session: Session, key: L, default: str) -> str: ...
 
     def get(self, session: Session, key: L, default: str | None = None) -> str | None:
-        if key in self._cache:
-            return self._cache[key]
-        return (
-            session.exec(select(Config.value).where(Config.key == key)).one_or_none()
-            or default
-        )
+        hit = self._cache.get(key)
+        if hit and hit[0] + _CONFIG_TTL > time.monotonic():
+            value = hit[1]
+        else:
+            generation = StringConfigCache._generation
+            value = (
+                session.exec(
+                    select(Config.value).where(Config.key == key)
+                ).one_or_none()
+                or None
+            )
+            with self._lock:
+                if generation == StringConfigCache._generation:
+                    self._cache[key] = (time.monotonic(), value)
+        return default if value is None else value
+
+    def _store(self, key: L, value: str | None):
+        with self._lock:
+            StringConfigCache._generation += 1
+            self._cache[key] = (time.monotonic(), value)
 
     def set(self, session: Session, key: L, value: str):
         old = session.exec(select(Config).where(Config.key == key)).one_or_none()
@@ -59,15 +108,14 @@ class StringConfigCache[L: str]:
             old = Config(key=key, value=value)
         session.add(old)
         session.commit()
-        self._cache[key] = value
+        self._store(key, value)
 
     def delete(self, session: Session, key: L):
         old = session.exec(select(Config).where(Config.key == key)).one_or_none()
         if old:
             session.delete(old)
             session.commit()
-        if key in self._cache:
-            del self._cache[key]
+        self._store(key, None)
 
     @overload
     def get_int(self, session: Session, key: L) -> int | None: ...
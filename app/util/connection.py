@@ -2,10 +2,37 @@ import aiohttp
 
 from app.internal.env_settings import Settings
 
+_client_session: aiohttp.ClientSession | None = None
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """
+    Application wide session, so connections (and DNS lookups) are reused across
+    requests and background tasks. Has to be called from within the event loop.
+    """
+    global _client_session
+    if _client_session is None or _client_session.closed:
+        _client_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(30),
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+            ),
+        )
+    return _client_session
+
+
+async def close_shared_session():
+    global _client_session
+    if _client_session is not None:
+        await _client_session.close()
+        _client_session = None
+
 
 async def get_connection():
-    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(30)) as session:
-        yield session
+    yield get_shared_session()
 
 
 USER_AGENT = (
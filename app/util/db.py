@@ -1,3 +1,6 @@
+from contextlib import contextmanager
+from typing import Iterator
+
 from sqlalchemy import create_engine
 from sqlmodel import Session, text
 
@@ -13,8 +16,15 @@ else:
     engine = create_engine(f"sqlite+pysqlite:///{sqlite_path}")
 
 
-def get_session():
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """Opens a session outside of a request, e.g. on startup or in background tasks."""
     with Session(engine) as session:
-        if not Settings().db.use_postgres:
+        if not db.use_postgres:
             session.execute(text("PRAGMA foreign_keys=ON"))
         yield session
+
+
+def get_session():
+    with session_scope() as session:
+        yield session
@@ -3,6 +3,8 @@ from starlette.datastructures import URL
 
 from app.internal.env_settings import Settings
 
+base_url = Settings().app.base_url.rstrip("/")
+
 
 class BaseUrlRedirectResponse(RedirectResponse):
     """
@@ -16,7 +18,7 @@ class BaseUrlRedirectResponse(RedirectResponse):
             or isinstance(url, URL)
             and url.path.startswith("/")
         ):
-            url = f"{Settings().app.base_url.rstrip('/')}{url}"
+            url = f"{base_url}{url}"
         super().__init__(
             url=url,
             status_code=status_code,